@@ -1,6 +1,12 @@
-from typing import Optional, Any
+import copy
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Any, Callable, ContextManager, Iterator, List, Union
 
 from selene import browser
+from selene.common.fp import identity
+from selene.core.exceptions import TimeoutException
+from selene.core.wait import Wait
 
 from selenite.common import predicate
 
@@ -12,14 +18,100 @@ DEFAULT_MSG_IS_NONE = 'Object should be None'
 DEFAULT_MSG_IS_NOT_NONE = 'Object should not be None'
 DEFAULT_MSG_IN = 'Object {obj} should be in container {container}'
 DEFAULT_MSG_NOT_IN = 'Object {obj} should not be in container {container}'
+DEFAULT_MSG_SOFT = '{count} soft assertion(s) failed:\n{failures}'
+
+_soft_failures: ContextVar[Optional[List[str]]] = ContextVar('soft_failures', default=None)
+
+
+def _wait(timeout: Optional[float] = None, hooked: bool = True) -> Wait:
+    """
+    Return browser.wait, with another timeout if given, keeping its polling, its decorator
+    and, unless hooked is False, its failure hooks.
+    """
+    wait = browser.wait
+    if timeout is None and hooked:
+        return wait
+    wait = copy.copy(wait)
+    if timeout is not None:
+        wait._timeout = timeout
+    if not hooked:
+        wait._hook_failure = identity
+    return wait
+
+
+def _message(msg: Union[str, Callable[[], str], None]) -> Optional[str]:
+    return msg() if callable(msg) else msg
+
+
+def _check(
+        fn: Callable[[Any], Any],
+        timeout: Optional[float] = None,
+        reason: Union[str, Callable[[], str], None] = None
+) -> None:
+    """
+    Wait for fn to pass, or, inside soft_assertions, record its failure, or reason, built on failure
+    if callable, without the failure hooks.
+    """
+    failures = _soft_failures.get()
+    if failures is None:
+        _wait(timeout).for_(fn)
+        return
+    try:
+        _wait(timeout, hooked=False).for_(fn)
+    except TimeoutException as error:
+        failures.append(_message(reason) or error.msg.strip())
+
+
+@contextmanager
+def soft_assertions() -> Iterator[List[str]]:
+    """
+    Collect the failures of web_assert and FormPage.should_* calls instead of raising the first one,
+    and raise a single AssertionError listing all of them on exit.
+
+    The wait failure hooks (screenshot, page source) fire once, for the aggregated failure.
+
+    Yields:
+        List[str]: The failure messages collected so far.
+
+    Example:
+        >>> with soft_assertions():
+        ...     web_assert.is_equal(page.name, 'John')
+        ...     web_assert.is_equal(page.city, 'Paris')
+        AssertionError: 2 soft assertion(s) failed: ...
+    """
+    outer = _soft_failures.get()
+    failures = []
+    token = _soft_failures.set(failures)
+    try:
+        yield failures
+    finally:
+        _soft_failures.reset(token)
+    if not failures:
+        return
+    if outer is not None:
+        outer.extend(failures)
+        return
+
+    msg = DEFAULT_MSG_SOFT.format(
+        count=len(failures),
+        failures='\n'.join(f'{i}. {failure}' for i, failure in enumerate(failures, 1))
+    )
+
+    def fn(entity: Any):
+        raise AssertionError(msg)
+
+    _wait(timeout=0).for_(fn)
 
 
 def failure_with_hook(condition: bool, msg: Optional[str] = None) -> None:
     """
-    Wait for a condition to be true, and raise an AssertionError if it is not.
+    Check an evaluated condition, and raise an AssertionError through the wait failure hooks if it is false.
+
+    The value can not change, so it is checked once instead of for the whole Selene timeout,
+    while the failure hooks (screenshot, page source) still fire.
 
     Args:
-        condition (bool): The condition to wait for.
+        condition (bool): The evaluated condition.
         msg (Optional[str]): The message to raise if the condition is not met.
 
     Returns:
@@ -33,7 +125,64 @@ def failure_with_hook(condition: bool, msg: Optional[str] = None) -> None:
         if not condition:
             raise AssertionError(msg)
 
-    browser.wait.for_(fn)
+    _check(fn, timeout=0, reason=msg)
+
+
+def polling_with_hook(
+        condition: Callable[[], bool],
+        msg: Union[str, Callable[[], str], None] = None,
+        timeout: Optional[float] = None
+) -> None:
+    """
+    Wait for a condition to become true, re-evaluating it on every poll,
+    and raise an AssertionError through the wait failure hooks if it times out.
+
+    Args:
+        condition (Callable[[], bool]): Evaluates the condition.
+        msg (Union[str, Callable[[], str], None]): The message to raise if the condition is not met,
+            or builds it on failure, e.g. to report the last value the condition observed.
+        timeout (Optional[float]): Seconds to wait, the Selene timeout if None.
+
+    Returns:
+        None
+
+    Example:
+        >>> polling_with_hook(lambda: len(browser.driver.window_handles) == 2, 'A new tab should open')
+        None
+    """
+    def fn(entity: Any):
+        if not condition():
+            raise AssertionError(_message(msg))
+
+    _check(fn, timeout, reason=msg)
+
+
+def should(entity: Any, condition: Any) -> Any:
+    """
+    Call entity.should(condition), recording the failure instead inside soft_assertions.
+
+    Args:
+        entity (Any): A Selene element, collection or browser.
+        condition (Any): A Selene condition, e.g. have.text('John').
+
+    Returns:
+        Any: The entity.
+
+    Example:
+        >>> should(browser.element('#name'), have.text('John'))
+        Element(...)
+    """
+    if _soft_failures.get() is None:
+        return entity.should(condition)
+    try:
+        entity.with_(
+            save_screenshot_on_failure=False,
+            save_page_source_on_failure=False,
+            hook_wait_failure=None
+        ).should(condition)
+    except TimeoutException as error:
+        _soft_failures.get().append(error.msg.strip())
+    return entity
 
 
 def _assert_with_hook_failure():
@@ -123,6 +272,64 @@ def _assert_with_hook_failure():
             msg = msg or DEFAULT_MSG_IN.format(obj=obj, container=container)
             return failure_with_hook(predicate.includes(obj)(container), msg)
 
+        @staticmethod
+        def eventually(
+                condition: Callable[[], bool],
+                msg: Union[str, Callable[[], str], None] = None,
+                timeout: Optional[float] = None
+        ) -> None:
+            """
+            Assert that a condition becomes true, re-evaluating it until the timeout.
+
+            Args:
+                condition (Callable[[], bool]): Evaluates the condition.
+                msg (Union[str, Callable[[], str], None]): The message to raise if the condition is not met,
+                    or builds it on failure.
+                timeout (Optional[float]): Seconds to wait, the Selene timeout if None.
+
+            Returns:
+                None
+
+            Example:
+                >>> Predicate.eventually(lambda: cart.count() == 3, 'Cart should hold 3 items', timeout=10)
+                None
+            """
+            return polling_with_hook(condition, msg or DEFAULT_MSG_TRUE, timeout)
+
+        @staticmethod
+        def should(entity: Any, condition: Any) -> Any:
+            """
+            Assert that a Selene entity matches a condition, softly inside Predicate.soft.
+
+            Args:
+                entity (Any): A Selene element, collection or browser.
+                condition (Any): A Selene condition, e.g. have.text('John').
+
+            Returns:
+                Any: The entity.
+
+            Example:
+                >>> Predicate.should(browser.element('#name'), have.text('John'))
+                Element(...)
+            """
+            return should(entity, condition)
+
+        @staticmethod
+        def soft() -> ContextManager[List[str]]:
+            """
+            Collect failures until the end of the block, see soft_assertions.
+
+            Returns:
+                ContextManager[List[str]]: The soft assertions context.
+
+            Example:
+                >>> with Predicate.soft():
+                ...     Predicate.is_equal(1, 2)
+                ...     Predicate.is_in(4, [1, 2, 3])
+                AssertionError: 2 soft assertion(s) failed: ...
+            """
+            return soft_assertions()
+
     return Predicate()
 
 
@@ -1,16 +1,45 @@
+import inspect
+import warnings
 from typing import Optional
 
 from selenite.conf.allure import report
 
 
+class _AwaitedStep:
+    """
+    The step of an async def, run and reported while it is awaited.
+    Warns if it is dropped without being awaited, as it then never ran.
+    """
+
+    def __init__(self, coroutine, name):
+        self._coroutine = coroutine
+        self._name = name
+        self._awaited = False
+
+    def __await__(self):
+        self._awaited = True
+        return self._coroutine.__await__()
+
+    def __del__(self):
+        if not self._awaited:
+            self._coroutine.close()
+            warnings.warn(f"Step '{self._name}' was never awaited, so it did not run", RuntimeWarning)
+
+
 def _step(description: Optional[str] = None):
     """
     Decorator for steps in BDD scenarios.
+
+    The step runs right away. The step of an async def is an awaitable instead,
+    the step runs and is reported while it is awaited, e.g. `await users_exist`.
     """
     def decorated(fn):
         if description:
             fn.__name__ = description.replace(' ', '_')
-        return report.step(fn, display_context=False)()
+        run = report.step(fn, display_context=False)
+        if inspect.iscoroutinefunction(fn):
+            return _AwaitedStep(run(), description or fn.__name__)
+        return run()
 
     return decorated
 
@@ -0,0 +1,67 @@
+import threading
+
+from allure_commons import plugin_manager
+from allure_commons.model2 import ExecutableItem
+
+
+class _Open(threading.local):
+    """
+    Steps of one thread started and not stopped yet, in start order, and the item
+    the Allure reporters nest top-level steps under.
+    """
+
+    def __init__(self):
+        self.uuids = []
+        self.roots = {}
+
+
+_open = _Open()
+
+
+def reporters():
+    """
+    Returns the AllureReporter of every registered Allure listener.
+    """
+    return [
+        plugin.allure_logger
+        for plugin in plugin_manager.get_plugins()
+        if hasattr(plugin, 'allure_logger')
+    ]
+
+
+def _move(uuid, from_uuid, to_uuid):
+    for reporter in reporters():
+        step = reporter.get_item(uuid)
+        source = reporter.get_item(from_uuid) if from_uuid else _open.roots.get(id(reporter))
+        target = reporter.get_item(to_uuid) if to_uuid else _open.roots.get(id(reporter))
+        if step is None or source is None or target is None or not source.steps or source.steps[-1] is not step:
+            continue
+        source.steps.pop()
+        target.steps.append(step)
+
+
+def start_step(uuid, title, params, parent_uuid=None):
+    """
+    Starts a step on the Allure listeners, nested under parent_uuid, the top level if None.
+
+    Allure nests a step under the step of the thread started last, concurrent asyncio tasks
+    share a thread, so a step started by another task is moved under its own parent.
+    """
+    opened = _open.uuids
+    placed_under = opened[-1] if opened else None
+    if not opened:
+        _open.roots = {id(reporter): reporter.get_last_item(ExecutableItem) for reporter in reporters()}
+
+    plugin_manager.hook.start_step(uuid=uuid, title=title, params=params)
+    opened.append(uuid)
+    if placed_under != parent_uuid:
+        _move(uuid, placed_under, parent_uuid)
+
+
+def stop_step(uuid, title, exc_type, exc_val, exc_tb):
+    """
+    Stops a step on the Allure listeners.
+    """
+    plugin_manager.hook.stop_step(uuid=uuid, title=title, exc_type=exc_type, exc_val=exc_val, exc_tb=exc_tb)
+    if uuid in _open.uuids:
+        _open.uuids.remove(uuid)
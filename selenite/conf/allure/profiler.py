@@ -0,0 +1,108 @@
+import json
+import os
+import threading
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Deque, Dict, List, Tuple, Union
+
+CAPACITY = 100_000
+
+enabled = False
+
+_records: Deque[Tuple[str, str, float, float, int]] = deque(maxlen=CAPACITY)
+
+
+def record(title: str, owner: str, started: float, stopped: float) -> None:
+    """
+    Records one step call, its start and stop given as time.perf_counter() values.
+
+    The buffer is a ring, once it holds capacity records the oldest ones are dropped.
+    """
+    _records.append((title, owner, started, stopped, threading.get_ident()))
+
+
+def _stats(durations: List[float]) -> dict:
+    ordered = sorted(durations)
+    total = sum(ordered)
+    return {
+        'count': len(ordered),
+        'total': total,
+        'mean': total / len(ordered),
+        'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
+
+
+def summary() -> Dict[str, Dict[str, dict]]:
+    """
+    Aggregates the recorded steps per title and per owner, the page-object class or module
+    the step was called on: count, total, mean and p95 of durations in seconds, slowest total first.
+
+    Example:
+        >>> summary()['steps']
+        {'open page': {'count': 120, 'total': 84.2, 'mean': 0.70, 'p95': 1.3}, ...}
+    """
+    by_title: Dict[str, List[float]] = defaultdict(list)
+    by_owner: Dict[str, List[float]] = defaultdict(list)
+    for title, owner, started, stopped, _ in list(_records):
+        by_title[title].append(stopped - started)
+        by_owner[owner].append(stopped - started)
+
+    def ranked(groups: Dict[str, List[float]]) -> Dict[str, dict]:
+        stats = {name: _stats(durations) for name, durations in groups.items()}
+        return dict(sorted(stats.items(), key=lambda item: item[1]['total'], reverse=True))
+
+    return {'steps': ranked(by_title), 'owners': ranked(by_owner)}
+
+
+def trace_events() -> List[dict]:
+    """
+    Returns the recorded steps as Chrome trace events, nested per thread by their times.
+    """
+    pid = os.getpid()
+    return [
+        {
+            'name': title,
+            'cat': owner,
+            'ph': 'X',
+            'ts': started * 1_000_000,
+            'dur': (stopped - started) * 1_000_000,
+            'pid': pid,
+            'tid': tid,
+        }
+        for title, owner, started, stopped, tid in list(_records)
+    ]
+
+
+def dump(path: Union[str, Path], trace_path: Union[str, Path, None] = None) -> None:
+    """
+    Writes the summary to a JSON file and, with trace_path, a trace file for Perfetto or chrome://tracing.
+
+    Example:
+        >>> def pytest_sessionfinish(session):
+        ...     profiler.dump('reports/steps.json', 'reports/steps.trace.json')
+    """
+    Path(path).write_text(json.dumps(summary(), indent=2))
+    if trace_path:
+        Path(trace_path).write_text(json.dumps({'traceEvents': trace_events()}))
+
+
+def reset() -> None:
+    """
+    Drops every recorded step.
+    """
+    _records.clear()
+
+
+def enable(value: bool = True, capacity: int = CAPACITY) -> None:
+    """
+    Turns step profiling on, or off with False, keeping at most capacity records.
+
+    Example:
+        >>> def pytest_configure(config):
+        ...     profiler.enable()
+    """
+    global enabled, _records
+
+    enabled = bool(value)
+    if capacity != _records.maxlen:
+        _records = deque(_records, maxlen=capacity)
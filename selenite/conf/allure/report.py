@@ -1,54 +1,91 @@
 import collections
+import contextvars
 import inspect
 import re
-from functools import wraps, reduce
+import reprlib
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 
 from allure_commons import plugin_manager
 from allure_commons.utils import uuid4, represent
 
+from selenite.conf.allure import nesting, profiler, step_buffer
+from selenite.conf.python.etc import translator
+
+
+MAX_PARAM_LENGTH = 256
+MAX_PARAM_ITEMS = 32
+
+_bounded_repr = reprlib.Repr()
+_bounded_repr.maxlist = _bounded_repr.maxtuple = _bounded_repr.maxdict = MAX_PARAM_ITEMS
+_bounded_repr.maxset = _bounded_repr.maxfrozenset = MAX_PARAM_ITEMS
+_bounded_repr.maxstring = _bounded_repr.maxlong = _bounded_repr.maxother = MAX_PARAM_LENGTH
+
+
+def _is_reporting():
+    return bool(plugin_manager.hook.start_step.get_hookimpls())
+
+
+def _represent(value):
+    if isinstance(value, (list, tuple, set, frozenset, dict)) and len(value) > MAX_PARAM_ITEMS:
+        text = _bounded_repr.repr(value)
+    else:
+        text = represent(value)
+    return text if len(text) <= MAX_PARAM_LENGTH else text[:MAX_PARAM_LENGTH] + '...'
+
 
 def _humanify(string_with_underscores, /):
     return re.sub(r'_+', ' ', string_with_underscores).strip()
 
 
-def _fn_params_to_ordered_dict(func, *args, **kwargs):
+_func_spec = collections.namedtuple(
+    '_func_spec', 'args defaults varargs kwonlydefaults order is_bound')
+
+
+@lru_cache(maxsize=None)
+def _spec_of(func):
     spec = inspect.getfullargspec(func)
+    ordered_names = list(spec.args) + ([spec.varargs] if spec.varargs else []) + list(spec.kwonlyargs)
+    return _func_spec(
+        args=tuple(spec.args),
+        defaults=tuple(spec.defaults or ()),
+        varargs=spec.varargs,
+        kwonlydefaults=spec.kwonlydefaults or {},
+        order={name: index for index, name in enumerate(ordered_names)},
+        is_bound=bool(spec.args) and spec.args[0] in ('cls', 'self'),
+    )
+
+
+def _fn_params_to_ordered_dict(func, *args, **kwargs):
+    spec = _spec_of(func)
 
-    pos_or_named_ordered_names = list(spec.args)
     pos_without_defaults_dict = dict(zip(spec.args, args))
-    if spec.args and spec.args[0] in ['cls', 'self']:
+    if spec.is_bound:
         pos_without_defaults_dict.pop(spec.args[0], None)
 
     received_args_amount = len(args)
     pos_or_named_not_set = spec.args[received_args_amount:]
     pos_defaults_dict = \
-        dict(zip(pos_or_named_not_set, spec.defaults or []))
+        dict(zip(pos_or_named_not_set, spec.defaults))
 
     varargs = args[len(spec.args):]
     varargs_dict = \
         {spec.varargs: varargs} if (spec.varargs and varargs) else \
             {}
-    pos_or_named_or_vargs_ordered_names = \
-        pos_or_named_ordered_names + [spec.varargs] if varargs_dict else \
-            pos_or_named_ordered_names
-
-    pos_or_named_or_vargs_or_named_only_ordered_names = (
-            pos_or_named_or_vargs_ordered_names
-            + list(spec.kwonlyargs)
-    )
 
     items = {
         **pos_without_defaults_dict,
         **pos_defaults_dict,
         **varargs_dict,
-        **(spec.kwonlydefaults or {}),
+        **spec.kwonlydefaults,
         **kwargs,
     }.items()
 
     sorted_items = sorted(
-        map(lambda kv: (kv[0], represent(kv[1])), items),
-        key=
-        lambda x: pos_or_named_or_vargs_or_named_only_ordered_names.index(x[0])
+        map(lambda kv: (kv[0], _represent(kv[1])), items),
+        key=lambda x: spec.order.get(x[0], len(spec.order))
     )
 
     return collections.OrderedDict(sorted_items)
@@ -87,6 +124,9 @@ def step(
         )
 
 
+_current_step = contextvars.ContextVar('_current_step', default=None)
+
+
 class StepContext:
 
     def __init__(
@@ -110,33 +150,53 @@ class StepContext:
         self.derepresent_params = derepresent_params
         self.display_context = display_context
         self.translations = translations
+        self._parents = []
 
     def __enter__(self):
-        plugin_manager.hook.start_step(
-            uuid=self.uuid,
-            title=self.maybe_title or '',
-            params=self.params)
+        parent_uuid = _current_step.get()
+        self._parents.append(parent_uuid)
+        _current_step.set(self.uuid)
+        if step_buffer.enabled:
+            step_buffer.start_step(self.uuid, self.maybe_title or '', self.params, parent_uuid)
+            return
+        nesting.start_step(self.uuid, self.maybe_title or '', self.params, parent_uuid)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        plugin_manager.hook.stop_step(
-            uuid=self.uuid,
-            title=self.maybe_title or '',
-            exc_type=exc_type,
-            exc_val=exc_val,
-            exc_tb=exc_tb)
+        # set, not reset with a token: the step may be entered again before it exits,
+        # or exit in another context than it entered, e.g. after a task or thread hop
+        _current_step.set(self._parents.pop())
+        if step_buffer.enabled:
+            step_buffer.stop_step(self.uuid, self.maybe_title or '', exc_type, exc_val, exc_tb)
+            return
+        nesting.stop_step(self.uuid, self.maybe_title or '', exc_type, exc_val, exc_tb)
 
     def __call__(self, func):
+        spec = _spec_of(func)
+        humanified_name = _humanify(func.__name__)
+        module_name = func.__module__.split('.')[-1]
+        translate = translator(self.translations, cache_size=0)
+
         @wraps(func)
         def impl(*args, **kw):
             __tracebackhide__ = True
 
+            if not profiler.enabled:
+                return reported(*args, **kw)
+
+            started = time.perf_counter()
+            try:
+                return reported(*args, **kw)
+            finally:
+                owner = args[0].__class__.__name__ if args and spec.is_bound else module_name
+                profiler.record(self.maybe_title or humanified_name, owner, started, time.perf_counter())
+
+        def rendered(args, kw):
             params_dict = _fn_params_to_ordered_dict(func, *args, **kw)
+            passed_as_args = spec.args[:len(args)]
 
             def described(item):
                 (name, value) = item
-                spec = inspect.getfullargspec(func)
-                is_pos_or_named_passed_as_arg = \
-                    name in dict(zip(spec.args, args)).keys()
+                is_pos_or_named_passed_as_arg = name in passed_as_args
                 return str(value) if is_pos_or_named_passed_as_arg \
                     else f'{_humanify(name)} {value}'
 
@@ -152,7 +212,7 @@ class StepContext:
             params_values = list(params_dict.values())
 
             def title_to_display():
-                return self.maybe_title or _humanify(func.__name__)
+                return self.maybe_title or humanified_name
 
             def params_to_display():
                 if not params_values:
@@ -168,18 +228,13 @@ class StepContext:
                         + params_string)
 
             def context():
-
-                def is_method(fn):
-                    spec = inspect.getfullargspec(fn)
-                    return (args
-                            and spec.args
-                            and spec.args[0] in ['cls', 'self'])
+                is_method = bool(args) and spec.is_bound
 
                 maybe_module_name = \
-                    func.__module__.split('.')[-1] if not is_method(func) \
+                    module_name if not is_method \
                         else None
 
-                instance = args[0] if is_method(func) else None
+                instance = args[0] if is_method else None
                 instance_desc = str(instance)
                 maybe_instance_name = \
                     instance_desc if 'at 0x' not in instance_desc \
@@ -199,13 +254,206 @@ class StepContext:
                     + (context() if self.display_context else '')
             )
 
-            translated_name = reduce(
-                lambda text, item: text.replace(item[0], item[1]),
-                self.translations,
-                name_to_display
-            ) if self.translations else name_to_display
+            translated_name = translate(name_to_display)
+
+            return translated_name, params_dict
+
+        def reported(*args, **kw):
+            __tracebackhide__ = True
 
-            with StepContext(translated_name, params_dict):
+            policy = _policy
+            if not _is_reporting() or (policy and policy.exhausted()):
                 return func(*args, **kw)
 
+            translated_name, params_dict = rendered(args, kw)
+            with policy.reporting(translated_name, params_dict) if policy \
+                    else StepContext(translated_name, params_dict):
+                return func(*args, **kw)
+
+        async def reported_async(*args, **kw):
+            __tracebackhide__ = True
+
+            policy = _policy
+            if not _is_reporting() or (policy and policy.exhausted()):
+                return await func(*args, **kw)
+
+            translated_name, params_dict = rendered(args, kw)
+            with policy.reporting(translated_name, params_dict) if policy \
+                    else StepContext(translated_name, params_dict):
+                return await func(*args, **kw)
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_impl(*args, **kw):
+                __tracebackhide__ = True
+
+                started = time.perf_counter()
+                try:
+                    return await reported_async(*args, **kw)
+                finally:
+                    if profiler.enabled:
+                        owner = args[0].__class__.__name__ if args and spec.is_bound else module_name
+                        profiler.record(self.maybe_title or humanified_name, owner, started, time.perf_counter())
+
+            return async_impl
+
         return impl
+
+
+_MUTED = object()
+_policy_level = contextvars.ContextVar('_policy_level', default=None)
+
+
+class _Run:
+
+    def __init__(self, title, params):
+        self.title = title
+        self.params = params
+        self.count = 1
+        self.duration = 0.0
+
+
+class StepPolicy:
+    """
+    Bounds the number of steps report.step emits, for steps called in hot loops.
+
+    Consecutive calls with an identical title are collapsed: the first one is reported,
+    the others only counted and timed, and one aggregated step with their count and total
+    duration follows once the run ends. With sample_every every Nth call of a run is reported
+    as well. A failing call is always reported. Once budget steps are emitted, further steps
+    are neither rendered nor reported.
+
+    Args:
+        budget (Optional[int], optional): Maximum number of steps reported per policy use, e.g. per test. Defaults to None.
+        collapse (bool, optional): Whether consecutive identical steps are collapsed. Defaults to True.
+        sample_every (Optional[int], optional): Report every Nth call of a collapsed run. Defaults to None.
+    """
+
+    def __init__(self, *, budget=None, collapse=True, sample_every=None):
+        self.budget = budget
+        self.collapse = collapse
+        self.sample_every = sample_every
+        self.emitted = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _level(self):
+        """
+        Returns the level of the calling step: a [policy, run] pair holding the pending run
+        of the steps it calls, _MUTED inside a collapsed call.
+
+        The level is kept in a ContextVar, so asyncio tasks run by a step share its level,
+        steps called outside any step share the level of their thread.
+        """
+        level = _policy_level.get()
+        if level is not None and level[0] is self:
+            return level
+        if not hasattr(self._local, 'level'):
+            self._local.level = [self, None]
+        return self._local.level
+
+    def exhausted(self):
+        return self.budget is not None and self.emitted > self.budget
+
+    def _spend(self):
+        with self._lock:
+            self.emitted += 1
+            emitted = self.emitted
+        if self.budget is None or emitted <= self.budget:
+            return True
+        if emitted == self.budget + 1:
+            with StepContext(f'Step budget of {self.budget} is exhausted, further steps are not reported', {}):
+                pass
+        return False
+
+    def _flush(self, run):
+        if isinstance(run, _Run) and run.count > 1 and self._spend():
+            with StepContext(
+                    f'{run.title} [x{run.count}, {run.duration:.3f}s total]',
+                    {'count': str(run.count), 'total duration': f'{run.duration:.3f}s'}):
+                pass
+
+    def flush(self):
+        """
+        Reports the aggregated step of the current run of the calling step or thread, if any.
+        """
+        level = self._level()
+        self._flush(level[1])
+        level[1] = None
+
+    def _decide(self, title, params):
+        level = self._level()
+        run = level[1]
+        if run is _MUTED:
+            return None, None
+        if self.collapse and run and run.title == title:
+            run.count += 1
+            if not (self.sample_every and run.count % self.sample_every == 0):
+                return _MUTED, run
+        else:
+            self.flush()
+            run = level[1] = _Run(title, params) if self.collapse else None
+        return (StepContext if self._spend() else None), run
+
+    @contextmanager
+    def reporting(self, title, params):
+        """
+        Reports the step run in the block as the policy allows, for sync and async steps alike.
+
+        Steps called by a collapsed call are muted, they are neither reported nor counted,
+        as their parent is not reported either.
+        """
+        decision, run = self._decide(title, params)
+        if decision is None:
+            yield
+            return
+
+        started = time.perf_counter()
+        token = _policy_level.set([self, _MUTED if decision is _MUTED else None])
+        try:
+            try:
+                if decision is _MUTED:
+                    yield
+                else:
+                    with StepContext(title, params):
+                        try:
+                            yield
+                        finally:
+                            self._flush(_policy_level.get()[1])
+            finally:
+                _policy_level.reset(token)
+                if run:
+                    run.duration += time.perf_counter() - started
+        except BaseException:
+            if decision is _MUTED:
+                self.flush()
+                if self._spend():
+                    with StepContext(title, params):
+                        raise
+            raise
+
+
+_policy = None
+
+
+@contextmanager
+def use_step_policy(*, budget=None, collapse=True, sample_every=None):
+    """
+    Applies a StepPolicy to every report.step call while the context is active,
+    and reports the pending aggregated step on exit.
+
+    Example:
+        >>> @pytest.fixture(autouse=True)
+        ... def bounded_steps():
+        ...     with use_step_policy(budget=2000, sample_every=100):
+        ...         yield
+    """
+    global _policy
+
+    policy = StepPolicy(budget=budget, collapse=collapse, sample_every=sample_every)
+    previous, _policy = _policy, policy
+    try:
+        yield policy
+    finally:
+        _policy = previous
+        policy.flush()
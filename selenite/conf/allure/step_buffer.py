@@ -0,0 +1,124 @@
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+import allure_commons
+from allure_commons import plugin_manager
+from allure_commons.utils import now
+
+from selenite.conf.allure import nesting
+from selenite.conf.allure.nesting import reporters
+
+enabled = False
+
+
+class _Events(threading.local):
+    """
+    Step events of one thread not dispatched yet, and the depth of its open steps.
+    """
+
+    def __init__(self):
+        self.pending = []
+        self.depth = 0
+
+
+_events = _Events()
+
+
+class _FlushBeforeAttach:
+    """
+    Dispatches buffered steps before an attachment, so it lands in the step it was made in.
+    """
+
+    @allure_commons.hookimpl(tryfirst=True)
+    def attach_data(self):
+        flush()
+
+    @allure_commons.hookimpl(tryfirst=True)
+    def attach_file(self):
+        flush()
+
+
+_flush_before_attach = _FlushBeforeAttach()
+
+
+def start_step(uuid, title, params, parent_uuid=None) -> None:
+    """
+    Buffers the start of a step nested under parent_uuid, timestamped now.
+    """
+    _events.pending.append(('start', uuid, title, (params, parent_uuid), now()))
+    _events.depth += 1
+
+
+def stop_step(uuid, title, exc_type, exc_val, exc_tb) -> None:
+    """
+    Buffers the stop of a step, timestamped now, and dispatches the buffer once the outermost step stops.
+    """
+    _events.pending.append(('stop', uuid, title, (exc_type, exc_val, exc_tb), now()))
+    _events.depth -= 1
+    if _events.depth <= 0:
+        flush()
+
+
+def flush() -> None:
+    """
+    Dispatches the buffered step events of the calling thread to the Allure listeners, in order,
+    synchronously: the listeners' I/O runs on the calling thread before flush returns.
+
+    Listeners stamp steps when they receive them, so the recorded timestamps are restored
+    on the step results of every Allure reporter afterwards.
+    """
+    pending, _events.pending = _events.pending, []
+    if not pending:
+        return
+    loggers = reporters()
+
+    for kind, uuid, title, payload, timestamp in pending:
+        if kind == 'start':
+            params, parent_uuid = payload
+            nesting.start_step(uuid, title, params, parent_uuid)
+            steps = [reporter.get_item(uuid) for reporter in loggers]
+            for step in filter(None, steps):
+                step.start = timestamp
+        else:
+            steps = [reporter.get_item(uuid) for reporter in loggers]
+            exc_type, exc_val, exc_tb = payload
+            nesting.stop_step(uuid, title, exc_type, exc_val, exc_tb)
+            for step in filter(None, steps):
+                step.stop = timestamp
+
+
+@contextmanager
+def buffered() -> Iterator[None]:
+    """
+    Buffers the step events of StepContext and report.step while the context is active.
+
+    Nested steps are not dispatched while their UI actions run, but at once when the outermost
+    step stops, before an attachment, on exit of the context, or at interpreter exit.
+    Allure keeps step state per thread, so events are always dispatched on the thread that made them:
+    there is no background writer, flushing is synchronous and the listeners' I/O still runs on the
+    test thread. Buffering only moves it out of nested UI actions, to the end of the outermost step.
+
+    Example:
+        >>> @pytest.fixture(autouse=True)
+        ... def buffered_steps():
+        ...     with step_buffer.buffered():
+        ...         yield
+    """
+    global enabled
+
+    previous, enabled = enabled, True
+    if not plugin_manager.is_registered(_flush_before_attach):
+        plugin_manager.register(_flush_before_attach)
+    try:
+        yield
+    finally:
+        enabled = previous
+        flush()
+        _events.depth = 0
+        if not previous:
+            plugin_manager.unregister(_flush_before_attach)
+
+
+atexit.register(flush)
@@ -0,0 +1,22 @@
+from typing import Iterator
+
+import pytest
+
+from selenite.core.api.requests.stand_in import StandInServer
+
+
+@pytest.fixture
+def stand_in_server() -> Iterator[StandInServer]:
+    """
+    A started StandInServer every HttpDecorator endpoint is pointed at for the test.
+
+    Example:
+        >>> # conftest.py
+        >>> from selenite.conf.pytest.stand_in import stand_in_server
+        >>>
+        >>> def test_get_user(stand_in_server):
+        ...     stand_in_server.route('GET', '/users/1', {'id': 1})
+        ...     assert UserApi().get_user(1).json() == {'id': 1}
+    """
+    with StandInServer() as server:
+        yield server
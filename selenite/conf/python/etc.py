@@ -1,5 +1,37 @@
+import re
+from functools import lru_cache
+from typing import Callable, Iterable, Tuple
+
+
 def list_intersection(one: list, another: list, /):
     """
     Return intersection of two lists
     """
     return list(set(one) & set(another))
+
+
+def translator(translations: Iterable[Tuple[str, str]], /, *, cache_size: int = 1024) -> Callable[[str], str]:
+    """
+    Compile (old, new) pairs into a function replacing every old substring with its new one.
+
+    All pairs are applied in a single regex pass, the longest old substring winning where several match,
+    and the results of the last cache_size texts are memoized, unless cache_size is 0.
+
+    Example:
+        >>> translate = translator([(':--(', ':--)'), (':--/', ':--D')])
+        >>> translate('sad :--( confused :--/')
+        'sad :--) confused :--D'
+    """
+    mapping = {}
+    for old, new in translations:
+        if old:
+            mapping.setdefault(old, new)
+    if not mapping:
+        return str
+
+    pattern = re.compile('|'.join(map(re.escape, sorted(mapping, key=len, reverse=True))))
+
+    def translate(text: str) -> str:
+        return pattern.sub(lambda match: mapping[match.group()], text)
+
+    return lru_cache(maxsize=cache_size)(translate) if cache_size else translate
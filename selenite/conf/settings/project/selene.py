@@ -9,6 +9,8 @@ BrowserType = Literal['chrome', 'chromium', 'firefox', 'ie', 'edge']
 
 Scope = Literal['session', 'package', 'module', 'class', 'method', 'function']
 
+PollingStrategy = Literal['fixed', 'backoff', 'fast_start', 'mutation']
+
 
 class SeleneSettings(BaseSettings):
     """
@@ -21,6 +23,11 @@ class SeleneSettings(BaseSettings):
         browser_management_scope (Scope): Management scope of the browser to use.
         base_url (str): Base URL to use.
         timeout (float): Timeout value to use.
+        polling_strategy (PollingStrategy): How waits poll, see selenite.core.web.selene.polling.
+        polling_interval (float): Seconds between polls, the first one for backoff.
+        polling_max_interval (float): Longest pause between polls for backoff and mutation.
+        polling_backoff_factor (float): Factor the pause grows by after each poll for backoff.
+        polling_fast_start (int): Number of quick polls before backing off for fast_start.
         maximize_window (bool): Whether to maximize the window or not.
         window_width (int): Width of the window to use.
         window_height (int): Height of the window to use.
@@ -48,6 +55,7 @@ class SeleneSettings(BaseSettings):
         ...     browser_management_scope='session',
         ...     base_url='https://www.google.com',
         ...     timeout=10.0,
+        ...     polling_strategy='backoff',
         ...     maximize_window=True,
         ...     window_width=1920,
         ...     window_height=1080,
@@ -75,6 +83,12 @@ class SeleneSettings(BaseSettings):
 
     timeout: float = 5.0
 
+    polling_strategy: PollingStrategy = 'fixed'
+    polling_interval: float = 0.1
+    polling_max_interval: float = 1.0
+    polling_backoff_factor: float = 2.0
+    polling_fast_start: int = 5
+
     maximize_window: bool = False
     window_width: int = 1920
     window_height: int = 1080
@@ -0,0 +1,174 @@
+import asyncio
+import functools
+import inspect
+import weakref
+from http.cookiejar import DefaultCookiePolicy
+from typing import Callable, Awaitable
+
+import httpx
+from loguru import logger
+
+from selenite.core.api.requests.http_decorator import HttpDecorator, COMMON_HEADERS, RequestMethod, _is_method
+
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+)
+
+_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]' = weakref.WeakKeyDictionary()
+
+
+def shared_client() -> httpx.AsyncClient:
+    """
+    Returns the async HTTP client shared by every AsyncHttpDecorator call on the running event loop.
+
+    The client owns the connection pool, so concurrent calls reuse keep-alive connections
+    instead of opening one per request. A client is bound to the loop it was created on,
+    hence one client per loop. It never stores cookies, so concurrent calls can not leak them into each other.
+
+    Returns:
+        httpx.AsyncClient: The shared client of the running event loop.
+
+    Example:
+        >>> async def main():
+        ...     client = shared_client()
+        ...     return await client.get('https://jsonplaceholder.typicode.com/posts/1')
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(verify=False, limits=POOL_LIMITS)
+        client.cookies.jar.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _clients[loop] = client
+    return client
+
+
+async def close_shared_client() -> None:
+    """
+    Closes the shared async HTTP client of the running event loop, if any.
+
+    Returns:
+        None
+
+    Example:
+        >>> async def main():
+        ...     try:
+        ...         await asyncio.gather(*(create_user(i) for i in range(100)))
+        ...     finally:
+        ...         await close_shared_client()
+    """
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class AsyncHttpDecorator(HttpDecorator):
+    """
+    A decorator class that sends HTTP requests asynchronously to a specified URL.
+
+    It follows the same contract as HttpDecorator: the decorated function returns a dict
+    with url/json/params/data/files keys, and base_url/header are read from self.
+    The decorated function becomes awaitable, so many calls can run concurrently.
+    The sync-only options of HttpDecorator (cache, stream, timing, retry, breaker, model,
+    memoize_json, upload_progress) are not supported, passing one raises TypeError.
+
+    Args:
+        url (str): The URL to send the request to.
+        method (RequestMethod, optional): The HTTP method to use. Defaults to 'get'.
+
+    Example:
+        >>> @AsyncHttpDecorator(url='https://jsonplaceholder.typicode.com/posts', method='post')
+        >>> def create_post(title):
+        >>>     return {'json': {'title': title}}
+        >>>
+        >>> responses = await asyncio.gather(*(create_post(f'post {i}') for i in range(100)))
+    """
+
+    def __init__(
+            self,
+            url: str,
+            method: RequestMethod = 'get'
+    ) -> None:
+        super().__init__(url, method)
+
+    def __call__(
+            self,
+            func: Callable
+    ) -> Callable[..., Awaitable[httpx.Response]]:
+        """
+        The decorator function that sends the HTTP request.
+
+        Args:
+            func (Callable): The function to decorate, either plain or async.
+
+        Returns:
+            Callable[..., Awaitable[httpx.Response]]: The decorated coroutine function.
+
+        Example:
+            >>> @AsyncHttpDecorator(url='https://jsonplaceholder.typicode.com/posts/1')
+            >>> def get_post():
+            >>>     return {'params': {'userId': 1}}
+            >>>
+            >>> response = await get_post()
+        """
+        is_class = _is_method(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            """
+            The wrapper coroutine that sends the HTTP request.
+
+            Args:
+                *args: The positional arguments to pass to the decorated function.
+                **kwargs: The keyword arguments to pass to the decorated function.
+
+            Returns:
+                httpx.Response: The response from the HTTP request.
+
+            Raises:
+                httpx.HTTPError: If the request fails.
+            """
+            func_return = func(*args, **kwargs)
+            if inspect.isawaitable(func_return):
+                func_return = await func_return
+            func_return = dict(func_return or {})
+            func_im_self = args[0] if is_class else object
+
+            url = self._create_url(func_im_self, func_return)
+            session = self._get_session(func_im_self, func_return)
+
+            try:
+                res = await shared_client().request(self.method, url, **session)
+            except httpx.HTTPError as e:
+                logger.error(f'Request failed: {e}')
+                raise
+            else:
+                return res
+
+        return wrapper
+
+    @staticmethod
+    def _get_session(func_im_self: object, func_return: dict) -> dict:
+        """
+        Gets the session information for the request.
+
+        Args:
+            func_im_self (object): The instance the decorated method was called on.
+            func_return (dict): The dict returned by the decorated function.
+
+        Returns:
+            dict: The keyword arguments for httpx.AsyncClient.request.
+        """
+        headers = {**getattr(func_im_self, 'header', {}), **COMMON_HEADERS}
+
+        data = func_return.pop('data', None)
+        raw_content = isinstance(data, (str, bytes))
+
+        return {
+            'headers': headers,
+            'json': func_return.pop('json', None),
+            'params': func_return.pop('params', None),
+            'data': None if raw_content else data,
+            'content': data if raw_content else None,
+            'files': func_return.pop('files', None),
+        }
@@ -0,0 +1,317 @@
+import base64
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Optional, Iterator
+
+import requests
+from requests import PreparedRequest
+from requests.structures import CaseInsensitiveDict
+
+from selenite.core.api.requests.response import build_response
+
+CACHEABLE_METHODS = ('GET', 'HEAD')
+
+DEFAULT_VARY = ('Authorization', 'Token', 'Cookie', 'Accept', 'Accept-Language')
+
+REFRESHED_HEADERS = ('ETag', 'Last-Modified', 'Date', 'Expires', 'Cache-Control')
+
+
+def cache_directives(headers: CaseInsensitiveDict) -> Dict[str, Optional[str]]:
+    """
+    Parses the Cache-Control header into lower-cased directive names and their values, None if valueless.
+
+    Example:
+        >>> cache_directives(CaseInsensitiveDict({'Cache-Control': 'private, max-age=30'}))
+        {'private': None, 'max-age': '30'}
+    """
+    directives = {}
+    for part in headers.get('Cache-Control', '').split(','):
+        name, _, value = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+class CachedEntry:
+    """
+    A stored response together with its validators.
+
+    Args:
+        status_code (int): The HTTP status code of the stored response.
+        headers (dict): The response headers.
+        content (bytes): The response body.
+        url (str): The final URL of the response.
+        stored_at (float): Wall clock time the response was stored or last revalidated.
+    """
+
+    def __init__(
+            self,
+            *,
+            status_code: int,
+            headers: dict,
+            content: bytes,
+            url: str,
+            stored_at: float
+    ) -> None:
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.url = url
+        self.stored_at = stored_at
+
+    @property
+    def validators(self) -> dict:
+        """
+        Conditional request headers that revalidate this entry.
+
+        Returns:
+            dict: If-None-Match/If-Modified-Since headers, empty if the server sent neither ETag nor Last-Modified.
+        """
+        validators = {}
+        if 'ETag' in self.headers:
+            validators['If-None-Match'] = self.headers['ETag']
+        if 'Last-Modified' in self.headers:
+            validators['If-Modified-Since'] = self.headers['Last-Modified']
+        return validators
+
+    def fresh_for(self, ttl: float) -> float:
+        """
+        Seconds the entry is served without revalidation: none with no-cache, at most max-age, at most ttl.
+        """
+        directives = cache_directives(self.headers)
+        if 'no-cache' in directives:
+            return 0.0
+        try:
+            return max(0.0, min(ttl, float(directives['max-age'])))
+        except (KeyError, TypeError, ValueError):
+            return ttl
+
+    def revalidated(self, res: requests.Response) -> 'CachedEntry':
+        """
+        Returns a new entry with the headers refreshed by a 304 answer, stored now.
+        """
+        headers = CaseInsensitiveDict(self.headers)
+        headers.update({name: res.headers[name] for name in REFRESHED_HEADERS if name in res.headers})
+        return CachedEntry(
+            status_code=self.status_code,
+            headers=dict(headers),
+            content=self.content,
+            url=self.url,
+            stored_at=time.time(),
+        )
+
+    @classmethod
+    def from_response(cls, res: requests.Response) -> 'CachedEntry':
+        """
+        Creates an entry from a received response.
+        """
+        return cls(
+            status_code=res.status_code,
+            headers=dict(res.headers),
+            content=res.content,
+            url=res.url,
+            stored_at=time.time(),
+        )
+
+    def to_response(self, request: PreparedRequest) -> requests.Response:
+        """
+        Builds a requests.Response from the entry, flagged with from_cache=True.
+        """
+        res = build_response(
+            request,
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            url=self.url,
+        )
+        res.from_cache = True
+        return res
+
+    def dumps(self) -> str:
+        """
+        Serializes the entry to JSON, the body base64 encoded.
+        """
+        return json.dumps({
+            'status_code': self.status_code,
+            'headers': dict(self.headers),
+            'content': base64.b64encode(self.content).decode('ascii'),
+            'url': self.url,
+            'stored_at': self.stored_at,
+        })
+
+    @classmethod
+    def loads(cls, raw: str) -> 'CachedEntry':
+        """
+        Restores an entry serialized with dumps.
+        """
+        payload = json.loads(raw)
+        payload['content'] = base64.b64decode(payload['content'])
+        return cls(**payload)
+
+
+class _DiskStore:
+    """
+    SQLite backed entry store shared by processes, e.g. pytest-xdist workers, on one machine.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, entry TEXT NOT NULL)')
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[CachedEntry]:
+        with self._connect() as conn:
+            row = conn.execute('SELECT entry FROM entries WHERE key = ?', (key,)).fetchone()
+        return CachedEntry.loads(row[0]) if row else None
+
+    def put(self, key: str, entry: CachedEntry) -> None:
+        with self._connect() as conn:
+            conn.execute('INSERT OR REPLACE INTO entries (key, entry) VALUES (?, ?)', (key, entry.dumps()))
+
+    def delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+
+
+class ResponseCache:
+    """
+    An opt-in cache of idempotent responses for HttpDecorator.
+
+    Entries live in an in-memory LRU and, if store is given, in a SQLite file shared by all processes
+    using the same path. An entry is served without a request while younger than ttl, or than its
+    Cache-Control max-age if shorter, never with no-cache, and no-store responses are not stored.
+    It is a client cache, private to the tests using it, so private responses are stored. Once stale,
+    it is revalidated with If-None-Match/If-Modified-Since if the server sent ETag/Last-Modified,
+    a 304 answer refreshes it, otherwise it is dropped.
+
+    Args:
+        ttl (float, optional): Seconds an entry is served without revalidation. Defaults to 60.
+        max_entries (int, optional): Size of the in-memory LRU. Defaults to 256.
+        store (Optional[str], optional): Path of the shared on-disk store. Defaults to None.
+        vary (Iterable[str], optional): Request headers that are part of the cache key. Defaults to DEFAULT_VARY.
+
+    Example:
+        >>> reference_data = ResponseCache(ttl=300, store='.api_cache.sqlite')
+        >>>
+        >>> class Dictionary:
+        ...     @HttpDecorator(url='/dict/countries', cache=reference_data)
+        ...     def countries(self):
+        ...         pass
+    """
+
+    def __init__(
+            self,
+            *,
+            ttl: float = 60.0,
+            max_entries: int = 256,
+            store: Optional[str] = None,
+            vary: Iterable[str] = DEFAULT_VARY
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.vary = tuple(vary)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._store = _DiskStore(store) if store else None
+
+    def key(self, request: PreparedRequest) -> str:
+        """
+        Returns the cache key of a request: method, URL with params, and the vary headers.
+        """
+        parts = [request.method, request.url]
+        parts.extend(f'{name}:{request.headers.get(name, "")}' for name in self.vary)
+        return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+    def _get(self, key: str) -> Optional[CachedEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        entry = self._store.get(key) if self._store else None
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: CachedEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _put(self, key: str, entry: CachedEntry) -> None:
+        self._remember(key, entry)
+        if self._store:
+            self._store.put(key, entry)
+
+    def _drop(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self._store:
+            self._store.delete(key)
+
+    def clear(self) -> None:
+        """
+        Drops every in-memory entry. The on-disk store is left as is.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def fetch(
+            self,
+            request: PreparedRequest,
+            send: Callable[[PreparedRequest], requests.Response]
+    ) -> requests.Response:
+        """
+        Serves the request from the cache, revalidates a stale entry, or sends it and stores the answer.
+
+        Args:
+            request (PreparedRequest): The request to serve.
+            send (Callable[[PreparedRequest], requests.Response]): Sends a request over the network.
+
+        Returns:
+            requests.Response: The cached or received response.
+        """
+        if request.method not in CACHEABLE_METHODS:
+            return send(request)
+
+        key = self.key(request)
+        entry = self._get(key)
+
+        if entry is not None and time.time() - entry.stored_at < entry.fresh_for(self.ttl):
+            return entry.to_response(request)
+
+        validators = entry.validators if entry is not None else {}
+        if entry is not None and not validators:
+            self._drop(key)
+
+        conditional = request.copy()
+        conditional.headers.update(validators)
+        res = send(conditional)
+
+        if res.status_code == 304 and validators:
+            entry = entry.revalidated(res)
+            self._put(key, entry)
+            return entry.to_response(request)
+
+        if res.status_code == 200 and 'no-store' not in cache_directives(res.headers):
+            entry = CachedEntry.from_response(res)
+            if entry.fresh_for(self.ttl) > 0 or entry.validators:
+                self._put(key, entry)
+        return res
@@ -0,0 +1,256 @@
+import base64
+import gzip
+import hashlib
+import json
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Literal, Optional, Union
+
+import requests
+from requests import PreparedRequest, RequestException
+
+from selenite.core.api.requests.response import build_response
+
+CassetteMode = Literal['record', 'replay']
+
+record: CassetteMode = 'record'
+replay: CassetteMode = 'replay'
+
+_active: Optional['Cassette'] = None
+
+
+class CassetteMiss(RequestException):
+    """
+    Raised in replay mode when the cassette holds no interaction matching the request.
+    """
+
+
+class _RecordingBody:
+    """
+    Proxies the raw body of a streamed response, recording the body once the caller has read it
+    or, when the response is closed before, after reading the rest.
+    """
+
+    def __init__(self, raw, record: Callable[[bytes], None]) -> None:
+        self._raw = raw
+        self._record = record
+        self._chunks: List[bytes] = []
+        self._recorded = False
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def _finish(self) -> None:
+        if not self._recorded:
+            self._recorded = True
+            self._record(b''.join(self._chunks))
+
+    def stream(self, amt=2 ** 16, decode_content=None):
+        for chunk in self._raw.stream(amt, decode_content=decode_content):
+            self._chunks.append(chunk)
+            yield chunk
+        self._finish()
+
+    def read(self, amt=None, decode_content=None, **kwargs):
+        data = self._raw.read(amt, decode_content=decode_content, **kwargs)
+        if data:
+            self._chunks.append(data)
+        if not data or amt is None:
+            self._finish()
+        return data
+
+    def close(self) -> None:
+        if not self._recorded:
+            for _ in self.stream(decode_content=True):
+                pass
+        self._raw.close()
+
+
+class Cassette:
+    """
+    Records HttpDecorator interactions to a file, or replays them from it without network.
+
+    The file is gzip compressed JSON lines, one interaction per line, appended as requests go.
+    On replay the file is read once into a dict keyed by request fingerprint (method, URL with params,
+    body digest and match_headers), so every lookup is O(1). Interactions recorded for the same
+    fingerprint are replayed in recorded order, the last one repeating once exhausted.
+
+    Args:
+        path (Union[str, Path]): The cassette file.
+        mode (CassetteMode, optional): 'record' to send and store, 'replay' to serve from the file. Defaults to 'replay'.
+        match_headers (Iterable[str], optional): Request headers that are part of the fingerprint. Defaults to ().
+
+    Example:
+        >>> with use_cassette('tests/cassettes/setup.jsonl.gz', mode='record'):
+        ...     api.create_user('John')
+    """
+
+    def __init__(
+            self,
+            path: Union[str, Path],
+            *,
+            mode: CassetteMode = replay,
+            match_headers: Iterable[str] = ()
+    ) -> None:
+        self.path = Path(path)
+        self.mode = mode
+        self.match_headers = tuple(match_headers)
+        self._lock = threading.Lock()
+        self._index: Dict[str, List[dict]] = defaultdict(list)
+        self._played: Dict[str, int] = defaultdict(int)
+        self._file = None
+
+        if mode == replay:
+            self._load()
+
+    def _load(self) -> None:
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                interaction = json.loads(line)
+                self._index[interaction['key']].append(interaction)
+
+    def fingerprint(self, request: PreparedRequest) -> str:
+        """
+        Returns the key an interaction is stored and looked up with.
+
+        Raises:
+            TypeError: If the request body can not be fingerprinted, e.g. a generator or a file object,
+                so different bodies would share a key.
+        """
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        if body is None:
+            digest = ''
+        elif isinstance(body, bytes):
+            digest = hashlib.sha256(body).hexdigest()
+        elif hasattr(body, 'digest'):
+            digest = body.digest()
+        else:
+            raise TypeError(f'Can not fingerprint a {type(body).__name__} body of {request.method} {request.url} '
+                            f'for {self.path}, send bytes, str or files instead')
+        parts = [request.method, request.url, digest]
+        parts.extend(f'{name}:{request.headers.get(name, "")}' for name in self.match_headers)
+        return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+    def fetch(
+            self,
+            request: PreparedRequest,
+            send: Callable[[PreparedRequest], requests.Response]
+    ) -> requests.Response:
+        """
+        Serves the request from the cassette in replay mode, or sends and records it in record mode.
+
+        A streamed response is recorded as the caller reads it, so the body stays on the socket until then.
+
+        Args:
+            request (PreparedRequest): The request to serve.
+            send (Callable[[PreparedRequest], requests.Response]): Sends a request over the network.
+
+        Returns:
+            requests.Response: The replayed or received response.
+
+        Raises:
+            CassetteMiss: If nothing matching the request was recorded, in replay mode.
+        """
+        key = self.fingerprint(request)
+
+        if self.mode == replay:
+            return self._replay(key, request)
+
+        res = send(request)
+        if res._content_consumed:
+            self._record(key, request, res, res.content)
+        else:
+            res.raw = _RecordingBody(res.raw, lambda content: self._record(key, request, res, content))
+        return res
+
+    def _replay(self, key: str, request: PreparedRequest) -> requests.Response:
+        with self._lock:
+            interactions = self._index.get(key)
+            if not interactions:
+                raise CassetteMiss(f'No interaction recorded in {self.path} for {request.method} {request.url}')
+            played = self._played[key]
+            self._played[key] = played + 1
+
+        interaction = interactions[min(played, len(interactions) - 1)]
+        res = build_response(
+            request,
+            status_code=interaction['status_code'],
+            headers=interaction['headers'],
+            content=base64.b64decode(interaction['content']),
+            url=interaction['url'],
+        )
+        res.from_cassette = True
+        return res
+
+    def _record(self, key: str, request: PreparedRequest, res: requests.Response, content: bytes) -> None:
+        line = json.dumps({
+            'key': key,
+            'method': request.method,
+            'request_url': request.url,
+            'status_code': res.status_code,
+            'headers': dict(res.headers),
+            'content': base64.b64encode(content).decode('ascii'),
+            'url': res.url,
+        })
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = gzip.open(self.path, 'wt', encoding='utf-8')
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def close(self) -> None:
+        """
+        Closes the cassette file being recorded, if any.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def current() -> Optional[Cassette]:
+    """
+    Returns the cassette every HttpDecorator call currently goes through, if any.
+    """
+    return _active
+
+
+@contextmanager
+def use_cassette(
+        path: Union[str, Path],
+        *,
+        mode: CassetteMode = replay,
+        match_headers: Iterable[str] = ()
+) -> Iterator[Cassette]:
+    """
+    Routes every HttpDecorator call, from any thread, through a cassette while the context is active.
+
+    Args:
+        path (Union[str, Path]): The cassette file.
+        mode (CassetteMode, optional): 'record' or 'replay'. Defaults to 'replay'.
+        match_headers (Iterable[str], optional): Request headers that are part of the fingerprint. Defaults to ().
+
+    Returns:
+        Iterator[Cassette]: The active cassette.
+
+    Example:
+        >>> @pytest.fixture(scope='session', autouse=True)
+        ... def api_cassette(request):
+        ...     mode = 'record' if request.config.getoption('--record') else 'replay'
+        ...     with use_cassette('tests/cassettes/api.jsonl.gz', mode=mode):
+        ...         yield
+    """
+    global _active
+
+    cassette = Cassette(path, mode=mode, match_headers=match_headers)
+    previous, _active = _active, cassette
+    try:
+        yield cassette
+    finally:
+        _active = previous
+        cassette.close()
@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Tuple
+
+# Outcome of one call: the response (None on error), wall time of the call in seconds, the raised exception
+call_result = namedtuple('call_result', 'response latency error')
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket rate limiter.
+
+    Args:
+        rate (float): Tokens added per second, i.e. the sustained number of calls per second.
+        burst (int, optional): Maximum number of tokens the bucket holds. Defaults to 1.
+
+    Example:
+        >>> bucket = TokenBucket(rate=20, burst=5)
+        >>> bucket.acquire()
+    """
+
+    def __init__(
+            self,
+            *,
+            rate: float,
+            burst: int = 1
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f'rate should be positive, got {rate}')
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Takes one token, blocking until one is available or the timeout passes.
+
+        Args:
+            timeout (Optional[float], optional): Longest wait in seconds, unbounded if None. Defaults to None.
+
+        Returns:
+            bool: Whether a token was taken, False if none is available within the timeout.
+
+        Example:
+            >>> bucket = TokenBucket(rate=20)
+            >>> bucket.acquire(timeout=1)
+            True
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+def fan_out(
+        fn: Callable,
+        args_list: Iterable[Tuple],
+        *,
+        max_workers: int = 8,
+        rate: Optional[float] = None,
+        burst: int = 1
+) -> List[call_result]:
+    """
+    Calls fn once per argument tuple on a thread pool and returns the results in input order.
+
+    Meant for HttpDecorator-wrapped functions, e.g. creating hundreds of entities in a setup fixture.
+    A failing call does not stop the others, its exception is returned in the error field.
+
+    Args:
+        fn (Callable): The function to call, typically an HttpDecorator-wrapped one.
+        args_list (Iterable[Tuple]): The positional arguments of each call.
+        max_workers (int, optional): Maximum number of calls in flight. Defaults to 8.
+        rate (Optional[float], optional): Maximum calls started per second, unlimited if None. Defaults to None.
+        burst (int, optional): Number of calls allowed to start at once above the rate. Defaults to 1.
+
+    Returns:
+        List[call_result]: The result of each call, in the order of args_list.
+
+    Example:
+        >>> results = fan_out(api.create_user, [(f'user{i}',) for i in range(200)], max_workers=16, rate=50)
+        >>> [r.response.status_code for r in results]
+        [200, 200, ...]
+    """
+    bucket = TokenBucket(rate=rate, burst=burst) if rate else None
+
+    def call(args: Tuple) -> call_result:
+        if bucket:
+            bucket.acquire()
+        start = time.perf_counter()
+        try:
+            response = fn(*args)
+        except Exception as e:
+            return call_result(None, time.perf_counter() - start, e)
+        return call_result(response, time.perf_counter() - start, None)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(call, args_list))
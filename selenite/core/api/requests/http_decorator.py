@@ -1,13 +1,23 @@
 import functools
 import inspect
-from typing import Callable, Literal
+import threading
+import time
+from typing import Any, Callable, Literal, Optional
+from urllib.parse import urlsplit
 
 import requests
 import urllib3
 from loguru import logger
-from requests import Request, RequestException
+from requests import Request, RequestException, PreparedRequest
 from urllib3.exceptions import InsecureRequestWarning
 
+from selenite.core.api.requests import cassette, stand_in, timing
+from selenite.core.api.requests.cache import ResponseCache
+from selenite.core.api.requests.json_stream import iter_path
+from selenite.core.api.requests.multipart import MultipartEncoder, ProgressCallback
+from selenite.core.api.requests.response import charset_from_headers, memoize_json, parse_model
+from selenite.core.api.requests.retry import RetryPolicy, CircuitBreaker
+
 urllib3.disable_warnings(InsecureRequestWarning)
 
 RequestMethod = Literal['get', 'post', 'put', 'delete', 'head', 'options', 'trace']
@@ -17,6 +27,44 @@ COMMON_HEADERS = {
     'Accept': 'application/json, text/plain, */*',
 }
 
+_local = threading.local()
+
+
+@functools.lru_cache(maxsize=None)
+def _is_method(func: Callable) -> bool:
+    """
+    Returns whether a function is a method, i.e. its first argument is self. Introspected once per function.
+
+    Args:
+        func (Callable): The decorated function.
+
+    Returns:
+        bool: Whether base_url/header should be read from the first argument.
+    """
+    args = inspect.getfullargspec(func).args
+    return bool(args) and args[0] == 'self'
+
+
+def _session() -> requests.Session:
+    """
+    Returns the session of the current thread, creating it on first use.
+
+    Each thread keeps its own session so keep-alive connections are reused between calls
+    without sharing a session across threads. Its cookies are cleared after every call by _send,
+    so they follow the redirects of one call but never leak into the next. Its pools report connection timings
+    for endpoints with timing on.
+
+    Returns:
+        requests.Session: The session of the current thread.
+    """
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.mount('http://', timing.TimedHTTPAdapter())
+        session.mount('https://', timing.TimedHTTPAdapter())
+        _local.session = session
+    return session
+
 
 class HttpDecorator:
     """
@@ -25,6 +73,28 @@ class HttpDecorator:
     Args:
         url (str): The URL to send the request to.
         method (RequestMethod, optional): The HTTP method to use. Defaults to 'get'.
+        cache (Optional[ResponseCache], optional): The cache serving GET/HEAD responses. Defaults to None.
+        stream (bool, optional): Whether to leave the body on the socket until it is read,
+            e.g. with response.iter_chunks(res) or response.save_to(res, path) of the response module.
+            Not cached. Defaults to False.
+        timing (bool, optional): Whether to record a timing breakdown of every call, see timing.measure.
+            timing.enable() turns it on for all endpoints. Defaults to False.
+        retry (Optional[RetryPolicy], optional): How failed calls are retried. Defaults to None.
+        breaker (Optional[CircuitBreaker], optional): The circuit breaker, shared by endpoints of a host. Defaults to None.
+        model (Any, optional): A pydantic model, or a type such as List[Model], the JSON body of 2xx responses
+            is validated against and exposed as response.model, None for other responses. A mismatch raises
+            pydantic.ValidationError. Ignored with stream. Defaults to None.
+        memoize_json (bool, optional): Whether response.json() parses the body only once and returns
+            the same, shared object on every call, see response.memoize_json. Ignored with stream. Defaults to False.
+        upload_progress (Optional[ProgressCallback], optional): Called with (sent, total) bytes while
+            files are uploaded. Defaults to None.
+
+    Every response gets response.iter_path(path), which yields the JSON values matching a JSONPath-like
+    expression while parsing the body incrementally, see json_stream.iter_path. With stream it reads
+    from the socket, so huge bodies are never held in memory.
+
+    Files returned under the files key are streamed with a MultipartEncoder, a pathlib.Path value
+    is read from disk chunk by chunk, so uploads do not load whole files into memory.
 
     Example:
         >>> @HttpDecorator(url='https://jsonplaceholder.typicode.com/posts/1')
@@ -37,12 +107,27 @@ class HttpDecorator:
     def __init__(
             self,
             url: str,
-            method: RequestMethod = 'get'
+            method: RequestMethod = 'get',
+            *,
+            cache: Optional[ResponseCache] = None,
+            stream: bool = False,
+            timing: bool = False,
+            retry: Optional[RetryPolicy] = None,
+            breaker: Optional[CircuitBreaker] = None,
+            model: Any = None,
+            memoize_json: bool = False,
+            upload_progress: Optional[ProgressCallback] = None
     ) -> None:
         self.url = url
         self.method = method
-        self.func_return = {}
-        self.func_im_self = None
+        self.cache = cache
+        self.stream = stream
+        self.timing = timing
+        self.retry = retry
+        self.breaker = breaker
+        self.model = model
+        self.memoize_json = memoize_json
+        self.upload_progress = upload_progress
 
     def __call__(
             self,
@@ -64,15 +149,7 @@ class HttpDecorator:
             >>>
             >>> response = get_post()
         """
-        self.func = func
-        self.is_class = False
-
-        try:
-            if inspect.getfullargspec(self.func).args[0] == 'self':
-                self.is_class = True
-        except IndexError as e:
-            logger.error(f'IndexError: {e}')
-            pass
+        is_class = _is_method(func)
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -95,53 +172,155 @@ class HttpDecorator:
 
             Raises:
                 RequestException: If the request fails.
+                CassetteMiss: If the active cassette recorded nothing matching the request, in replay mode.
+                pydantic.ValidationError: If a 2xx body does not match the model.
             """
-            self.func_return = self.func(*args, **kwargs) or {}
-            self.func_im_self = args[0] if self.is_class else object
+            started = time.perf_counter()
+            func_return = dict(func(*args, **kwargs) or {})
+            func_im_self = args[0] if is_class else object
 
-            url = self._create_url()
-            session = self._get_session()
+            url = self._create_url(func_im_self, func_return)
+            session = self._get_session(func_im_self, func_return)
+            if session['files']:
+                session = self._stream_files(session)
 
             req = Request(self.method, url, **session)
             prepped = req.prepare()
 
             try:
-                res = requests.Session().send(prepped, verify=False)
-                res.encoding = res.apparent_encoding
+                if self.timing or timing.enabled:
+                    res = timing.measure(
+                        f'{self.method.upper()} {func.__qualname__}',
+                        started,
+                        lambda: self._call(prepped, stream=True),
+                        read_body=not self.stream,
+                    )
+                else:
+                    res = self._call(prepped, stream=self.stream)
+                res.encoding = charset_from_headers(res.headers)
+                res.iter_path = functools.partial(iter_path, res)
+                if self.memoize_json and not self.stream:
+                    memoize_json(res)
+            except cassette.CassetteMiss:
+                raise
             except RequestException as e:
                 logger.error(f'Request failed: {e}')
                 raise RequestException(f'Request failed: {e}')
-            else:
-                return res
+
+            if self.model is not None and not self.stream:
+                res.model = parse_model(self.model, res.json()) if res.ok else None
+            return res
 
         return wrapper
 
-    def _create_url(self) -> str:
+    def _call(self, prepped: PreparedRequest, stream: bool = False) -> requests.Response:
+        """
+        Fetches the response through the circuit breaker and the retry policy, if any.
+
+        Args:
+            prepped (PreparedRequest): The request to send.
+            stream (bool, optional): Whether to defer downloading the body. Defaults to False.
+
+        Returns:
+            requests.Response: The response from the HTTP request.
+        """
+        fetch = functools.partial(self._fetch, prepped, stream)
+        if self.breaker:
+            fetch = functools.partial(self.breaker.call, urlsplit(prepped.url).netloc, fetch)
+        if self.retry:
+            return self.retry.call(prepped, fetch)
+        return fetch()
+
+    def _fetch(self, prepped: PreparedRequest, stream: bool = False) -> requests.Response:
+        """
+        Sends a prepared request, through the cache unless the endpoint streams.
+
+        Args:
+            prepped (PreparedRequest): The request to send.
+            stream (bool, optional): Whether to defer downloading the body. Defaults to False.
+
+        Returns:
+            requests.Response: The response from the HTTP request.
+        """
+        if self.cache and not self.stream:
+            return self.cache.fetch(prepped, functools.partial(self._send, stream=stream))
+        return self._send(prepped, stream=stream)
+
+    @staticmethod
+    def _send(prepped: PreparedRequest, stream: bool = False) -> requests.Response:
+        """
+        Sends a prepared request over the session of the current thread,
+        or through the active cassette if one is in use.
+
+        Args:
+            prepped (PreparedRequest): The request to send.
+            stream (bool, optional): Whether to defer downloading the body. Defaults to False.
+
+        Returns:
+            requests.Response: The response from the HTTP request.
+        """
+        session = _session()
+        try:
+            active = cassette.current()
+            if active:
+                return active.fetch(prepped, lambda p: session.send(p, verify=False, stream=stream))
+            return session.send(prepped, verify=False, stream=stream)
+        finally:
+            session.cookies.clear()
+
+    def _create_url(self, func_im_self: object, func_return: dict) -> str:
         """
         Creates the URL to send the request to.
 
+        Args:
+            func_im_self (object): The instance the decorated method was called on.
+            func_return (dict): The dict returned by the decorated function.
+
         Returns:
-            str: The URL to send the request to.
+            str: The URL to send the request to, rebased onto the active StandInServer if any.
         """
-        base_url = getattr(self.func_im_self, 'base_url', '')
-        url = self.func_return.pop('url', None) or self.url
+        base_url = getattr(func_im_self, 'base_url', '')
+        url = ''.join([base_url, func_return.pop('url', None) or self.url])
+
+        server = stand_in.current()
+        return server.rebase(url) if server else url
+
+    def _stream_files(self, session: dict) -> dict:
+        """
+        Replaces the files and data of the session information with a streamed multipart body.
+
+        Args:
+            session (dict): The session information with files.
 
-        return ''.join([base_url, url])
+        Returns:
+            dict: The session information for the request.
+        """
+        encoder = MultipartEncoder(session['files'], session['data'], on_progress=self.upload_progress)
+        return {
+            **session,
+            'headers': {**session['headers'], 'Content-Type': encoder.content_type},
+            'data': encoder,
+            'files': None,
+        }
 
-    def _get_session(self) -> dict:
+    @staticmethod
+    def _get_session(func_im_self: object, func_return: dict) -> dict:
         """
         Gets the session information for the request.
 
+        Args:
+            func_im_self (object): The instance the decorated method was called on.
+            func_return (dict): The dict returned by the decorated function.
+
         Returns:
             dict: The session information for the request.
         """
-        headers = getattr(self.func_im_self, 'header', {})
-        headers.update(COMMON_HEADERS)
+        headers = {**getattr(func_im_self, 'header', {}), **COMMON_HEADERS}
 
-        json_data = self.func_return.pop('json', None)
-        params = self.func_return.pop('params', None)
-        data = self.func_return.pop('data', None)
-        files = self.func_return.pop('files', None)
+        json_data = func_return.pop('json', None)
+        params = func_return.pop('params', None)
+        data = func_return.pop('data', None)
+        files = func_return.pop('files', None)
 
         return {
             'headers': headers,
@@ -0,0 +1,260 @@
+import codecs
+import json
+import re
+from functools import lru_cache
+from typing import Any, Iterator, Tuple, Union
+
+import requests
+
+from selenite.core.api.requests.response import CHUNK_SIZE, iter_chunks
+
+WILDCARD = '*'
+
+Segment = Union[str, int]
+
+_SEGMENT = re.compile(r"""\.(\w+|\*)|\[(\*|\d+|'[^']*'|"[^"]*")\]""")
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_STRING_END = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[\s,\]}]')
+_WHITESPACE = ' \t\r\n'
+
+
+@lru_cache(maxsize=128)
+def parse_path(path: str) -> Tuple[Segment, ...]:
+    """
+    Splits a JSONPath-like expression into segments.
+
+    Supported are the root $, .key, ['key'], .* and [*] for every member or item, and [n] for one item.
+
+    Args:
+        path (str): The expression, e.g. '$.data.users[*].id'.
+
+    Returns:
+        Tuple[Segment, ...]: The keys, indexes and WILDCARDs of the path.
+
+    Raises:
+        ValueError: If the expression is not supported.
+
+    Example:
+        >>> parse_path("$.data['users'][*].id")
+        ('data', 'users', '*', 'id')
+    """
+    rest = path[1:] if path.startswith('$') else path
+    segments, pos = [], 0
+    while pos < len(rest):
+        match = _SEGMENT.match(rest, pos)
+        if match is None:
+            raise ValueError(f'Unsupported JSON path {path!r} at {rest[pos:]!r}')
+        name, item = match.groups()
+        if name is not None:
+            segments.append(name)
+        elif item.isdigit():
+            segments.append(int(item))
+        else:
+            segments.append(item.strip('\'"') if item != WILDCARD else WILDCARD)
+        pos = match.end()
+    return tuple(segments)
+
+
+class _Reader:
+    """
+    A cursor over JSON text arriving in chunks.
+
+    Consumed text is dropped from the buffer as chunks arrive, except the value being captured,
+    so memory is bounded by the chunk size and the largest extracted value.
+    """
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self._chunks = chunks
+        self.buffer = ''
+        self.pos = 0
+        self.mark = None
+
+    def _more(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                break
+        else:
+            return False
+        keep = self.pos if self.mark is None else self.mark
+        self.buffer = self.buffer[keep:] + chunk
+        self.pos -= keep
+        if self.mark is not None:
+            self.mark = 0
+        return True
+
+    def _need(self) -> None:
+        if not self._more():
+            raise json.JSONDecodeError('Unexpected end of document', self.buffer, self.pos)
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character without consuming it, '' at the end.
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._more():
+                return ''
+
+    def take(self, expected: str) -> str:
+        """
+        Consumes the next character, which must be one of expected.
+        """
+        char = self.peek()
+        if not char or char not in expected:
+            raise json.JSONDecodeError(f'Expecting one of {expected!r}', self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def _skip_string(self) -> None:
+        self.pos += 1
+        while True:
+            match = _STRING_END.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                self._need()
+            elif match.group() == '"':
+                self.pos = match.end()
+                return
+            else:
+                self.pos = match.end()
+                while self.pos >= len(self.buffer):
+                    self._need()
+                self.pos += 1
+
+    def _skip_container(self) -> None:
+        depth = 0
+        while True:
+            match = _STRUCTURE.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                self._need()
+                continue
+            char = match.group()
+            if char == '"':
+                self.pos = match.start()
+                self._skip_string()
+                continue
+            self.pos = match.end()
+            depth += 1 if char in '[{' else -1
+            if depth == 0:
+                return
+
+    def _skip_scalar(self) -> None:
+        while True:
+            match = _SCALAR_END.search(self.buffer, self.pos)
+            if match is not None:
+                self.pos = match.start()
+                return
+            self.pos = len(self.buffer)
+            if not self._more():
+                return
+
+    def skip(self) -> None:
+        """
+        Consumes the next value without decoding it.
+        """
+        char = self.peek()
+        if char == '"':
+            self._skip_string()
+        elif char in ('[', '{'):
+            self._skip_container()
+        elif char:
+            self._skip_scalar()
+        else:
+            self._need()
+
+    def value(self) -> Any:
+        """
+        Consumes and decodes the next value.
+        """
+        self.peek()
+        self.mark = self.pos
+        try:
+            self.skip()
+            return json.loads(self.buffer[self.mark:self.pos])
+        finally:
+            self.mark = None
+
+
+def _walk(reader: _Reader, segments: Tuple[Segment, ...], single: bool) -> Iterator[Any]:
+    if not segments:
+        yield reader.value()
+        return
+
+    segment, rest = segments[0], segments[1:]
+    opening = reader.peek()
+    if opening not in ('{', '['):
+        reader.skip()
+        return
+
+    reader.pos += 1
+    closing = '}' if opening == '{' else ']'
+    if reader.peek() == closing:
+        reader.pos += 1
+        return
+
+    index = 0
+    while True:
+        if opening == '{':
+            selector = reader.value()
+            reader.take(':')
+        else:
+            selector = index
+        if segment == WILDCARD or segment == selector:
+            yield from _walk(reader, rest, single and segment != WILDCARD)
+            if single and segment != WILDCARD:
+                return
+        else:
+            reader.skip()
+        index += 1
+        if reader.take(',' + closing) == closing:
+            return
+
+
+def _decoded(res: requests.Response, chunk_size: int) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(res.encoding or 'utf-8')(errors='replace')
+    chunks = iter_chunks(res, chunk_size)
+    try:
+        for chunk in chunks:
+            yield decoder.decode(chunk)
+        yield decoder.decode(b'', final=True)
+    finally:
+        chunks.close()
+
+
+def iter_path(res: requests.Response, path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yields the values matching a JSONPath-like expression while the body is parsed incrementally.
+
+    Only matched values are decoded, everything else is skipped by a regex scanner, so memory stays
+    bounded by chunk_size and the largest match. With a response of an HttpDecorator(stream=True) endpoint
+    the body is read from the socket as values are consumed: first results arrive before the download ends,
+    and the connection is released as soon as the caller stops iterating, or once the only possible match
+    of a path without wildcards is found.
+
+    Args:
+        res (requests.Response): The response to read.
+        path (str): The expression, see parse_path.
+        chunk_size (int, optional): Maximum size of a chunk in bytes. Defaults to CHUNK_SIZE.
+
+    Returns:
+        Iterator[Any]: The decoded matches, in document order.
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON where it is read.
+
+    Example:
+        >>> res = api.export_orders()
+        >>> ids = [order_id for order_id in iter_path(res, '$.orders[*].id')]
+        >>> first = next(iter_path(api.export_orders(), '$.orders[0]'))
+    """
+    segments = parse_path(path)
+    chunks = _decoded(res, chunk_size)
+    try:
+        yield from _walk(_Reader(chunks), segments, single=True)
+    finally:
+        chunks.close()
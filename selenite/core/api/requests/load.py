@@ -0,0 +1,261 @@
+import json
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Callable, Dict, Mapping, Optional, Union
+
+import allure
+
+from selenite.core.api.requests.fan_out import TokenBucket
+
+SUB_BUCKET_BITS = 11
+SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class LatencyHistogram:
+    """
+    An HDR-style latency histogram with microsecond resolution and three significant digits.
+
+    Values below 2048us get a bucket each, larger ones share log-linear buckets whose width is
+    at most 1/1024 of their value, so memory stays small whatever the number of recorded values.
+
+    Example:
+        >>> histogram = LatencyHistogram()
+        >>> histogram.record(0.0123)
+        >>> histogram.percentile(99)
+        0.0123
+    """
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = defaultdict(int)
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    @staticmethod
+    def _index(micros: int) -> int:
+        shift = max(0, micros.bit_length() - SUB_BUCKET_BITS)
+        return shift * SUB_BUCKET_HALF + (micros >> shift)
+
+    @staticmethod
+    def _lowest(index: int) -> int:
+        shift = max(0, index // SUB_BUCKET_HALF - 1)
+        return (index - shift * SUB_BUCKET_HALF) << shift
+
+    def record(self, seconds: float) -> None:
+        """
+        Records one latency value given in seconds.
+        """
+        self.counts[self._index(int(seconds * 1_000_000))] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: 'LatencyHistogram') -> 'LatencyHistogram':
+        """
+        Adds the values of another histogram to this one.
+        """
+        for index, count in other.counts.items():
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns the latency in seconds below which the given percent of values fall.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, round(percent / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(max(self._lowest(index) / 1_000_000, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        """
+        Returns count, min, mean, max and the PERCENTILES, in seconds.
+        """
+        return {
+            'count': self.count,
+            'min': self.min if self.count else 0.0,
+            'mean': self.total / self.count if self.count else 0.0,
+            'max': self.max,
+            **{f'p{p}': self.percentile(p) for p in PERCENTILES},
+        }
+
+
+class LoadResult:
+    """
+    Latency histograms and errors of a load run, per endpoint and overall.
+
+    Args:
+        duration (float): Wall time of the run in seconds.
+        histograms (Dict[str, LatencyHistogram]): Latencies per endpoint name.
+        errors (Dict[str, Counter]): Error kinds and their counts per endpoint name.
+    """
+
+    def __init__(
+            self,
+            *,
+            duration: float,
+            histograms: Dict[str, LatencyHistogram],
+            errors: Dict[str, Counter]
+    ) -> None:
+        self.duration = duration
+        self.histograms = histograms
+        self.errors = errors
+
+    @property
+    def overall(self) -> LatencyHistogram:
+        """
+        Latencies of all endpoints merged.
+        """
+        overall = LatencyHistogram()
+        for histogram in self.histograms.values():
+            overall.merge(histogram)
+        return overall
+
+    def to_dict(self) -> dict:
+        """
+        Returns the summary of the run: throughput, error rate and latency percentiles, overall and per endpoint.
+        """
+        def summary(histogram: LatencyHistogram, errors: Counter) -> dict:
+            failed = sum(errors.values())
+            return {
+                **histogram.to_dict(),
+                'rps': histogram.count / self.duration if self.duration else 0.0,
+                'errors': failed,
+                'error_rate': failed / histogram.count if histogram.count else 0.0,
+                'error_kinds': dict(errors),
+            }
+
+        return {
+            'duration': self.duration,
+            'overall': summary(self.overall, sum(self.errors.values(), Counter())),
+            'endpoints': {
+                name: summary(histogram, self.errors[name])
+                for name, histogram in self.histograms.items()
+            },
+        }
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """
+        Writes the summary to a JSON file.
+        """
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2))
+
+    def attach_to_allure(self, name: str = 'load summary') -> None:
+        """
+        Attaches the summary as JSON to the current Allure test.
+        """
+        allure.attach(
+            body=json.dumps(self.to_dict(), indent=2),
+            name=name,
+            attachment_type=allure.attachment_type.JSON
+        )
+
+
+def _name_of(fn: Callable) -> str:
+    while not hasattr(fn, '__name__') and hasattr(fn, 'func'):
+        fn = fn.func
+    return getattr(fn, '__name__', repr(fn))
+
+
+def _error_of(outcome: object) -> Optional[str]:
+    status_code = getattr(outcome, 'status_code', None)
+    return f'HTTP {status_code}' if status_code is not None and status_code >= 400 else None
+
+
+def run_load(
+        mix: Union[Callable, Mapping[Callable, float]],
+        *,
+        duration: float,
+        rps: Optional[float] = None,
+        concurrency: int = 16,
+        burst: int = 1
+) -> LoadResult:
+    """
+    Calls HttpDecorator-wrapped endpoints for a duration and records their latencies and errors.
+
+    With rps the load is open: calls start at that rate, spread over up to concurrency threads,
+    at most burst of them at once. No call starts after the duration.
+    Without it the load is closed: concurrency threads call back to back.
+    Every call picks one endpoint of the mix by weight. A raised exception or a 4xx/5xx status is an error.
+
+    Args:
+        mix (Union[Callable, Mapping[Callable, float]]): An endpoint, or endpoints with their weights.
+            Endpoints take no arguments, bind them with functools.partial.
+        duration (float): Seconds to run.
+        rps (Optional[float], optional): Target calls per second, unlimited if None. Defaults to None.
+        concurrency (int, optional): Number of calling threads. Defaults to 16.
+        burst (int, optional): Number of calls allowed to start at once above rps. Defaults to 1.
+
+    Returns:
+        LoadResult: The latency histograms and errors of the run.
+
+    Example:
+        >>> api = UserApi()
+        >>> result = run_load({api.list_users: 8, partial(api.get_user, 1): 2}, duration=60, rps=200)
+        >>> result.dump('load.json')
+        >>> result.attach_to_allure()
+    """
+    weights = dict(mix) if isinstance(mix, Mapping) else {mix: 1}
+    endpoints, endpoint_weights = list(weights), list(weights.values())
+    names = {fn: _name_of(fn) for fn in endpoints}
+    bucket = TokenBucket(rate=rps, burst=burst) if rps else None
+
+    lock = threading.Lock()
+    histograms: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+    errors: Dict[str, Counter] = defaultdict(Counter)
+
+    start = time.monotonic()
+    deadline = start + duration
+
+    def worker() -> None:
+        own_histograms: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        own_errors: Dict[str, Counter] = defaultdict(Counter)
+        rnd = random.Random()
+
+        while True:
+            left = deadline - time.monotonic()
+            if left <= 0 or bucket and not bucket.acquire(timeout=left):
+                break
+            fn = rnd.choices(endpoints, endpoint_weights)[0]
+            call_start = time.perf_counter()
+            try:
+                error = _error_of(fn())
+            except Exception as e:
+                error = e.__class__.__name__
+            own_histograms[names[fn]].record(time.perf_counter() - call_start)
+            if error:
+                own_errors[names[fn]][error] += 1
+
+        with lock:
+            for name, histogram in own_histograms.items():
+                histograms[name].merge(histogram)
+            for name, counter in own_errors.items():
+                errors[name].update(counter)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return LoadResult(
+        duration=time.monotonic() - start,
+        histograms=dict(histograms),
+        errors=errors,
+    )
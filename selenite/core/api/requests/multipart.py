@@ -0,0 +1,224 @@
+import hashlib
+import io
+import mimetypes
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from loguru import logger
+
+CHUNK_SIZE = 64 * 1024
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def _pairs(fields: Union[Mapping, Sequence, None]) -> List[Tuple[str, Any]]:
+    if not fields:
+        return []
+    return list(fields.items()) if isinstance(fields, Mapping) else list(fields)
+
+
+def _quote(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+class _Part:
+    """
+    One part of the body: its header block and a source read on demand.
+    """
+
+    def __init__(self, header: bytes, source: Any, size: int) -> None:
+        self.header = header
+        self.source = source
+        self.size = size
+        self.length = len(header) + size + 2
+        self.start = None if isinstance(source, (bytes, Path)) else source.tell()
+
+    def rewind(self) -> None:
+        if self.start is not None:
+            self.source.seek(self.start)
+
+    def content(self, chunk_size: int) -> Iterator[bytes]:
+        if isinstance(self.source, bytes):
+            yield self.source
+        elif isinstance(self.source, Path):
+            with open(self.source, 'rb') as f:
+                yield from iter(lambda: f.read(chunk_size), b'')
+        else:
+            yield from iter(lambda: self.source.read(chunk_size), b'')
+
+    def chunks(self, chunk_size: int) -> Iterator[bytes]:
+        yield self.header
+        yield from self.content(chunk_size)
+        yield b'\r\n'
+
+
+class MultipartEncoder:
+    """
+    A multipart/form-data body streamed part by part, so files are read from disk in chunks
+    and memory stays flat whatever their size.
+
+    Accepts the same files shapes as requests: {name: file} or [(name, file)], where file is
+    a value or a (filename, value[, content_type[, headers]]) tuple. A pathlib.Path value is
+    opened and read only while its part is sent; a file object is read from its position;
+    str and bytes are sent as is.
+
+    Args:
+        files (Union[Mapping, Sequence]): The files to upload.
+        data (Union[Mapping, Sequence, None], optional): Plain form fields sent before the files. Defaults to None.
+        chunk_size (int, optional): Size of the chunks read from files. Defaults to CHUNK_SIZE.
+        on_progress (Optional[ProgressCallback], optional): Called with (sent, total) bytes after every chunk. Defaults to None.
+
+    Example:
+        >>> @HttpDecorator(url='/imports', method='post')
+        ... def import_file(self, path):
+        ...     return {'files': {'file': Path(path)}, 'data': {'type': 'orders'}}
+    """
+
+    def __init__(
+            self,
+            files: Union[Mapping, Sequence],
+            data: Union[Mapping, Sequence, None] = None,
+            *,
+            chunk_size: int = CHUNK_SIZE,
+            on_progress: Optional[ProgressCallback] = None
+    ) -> None:
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={self.boundary}'
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+
+        self._parts = [self._field_part(name, value) for name, value in _pairs(data)]
+        self._parts += [self._file_part(name, value) for name, value in _pairs(files)]
+        self._closing = f'--{self.boundary}--\r\n'.encode()
+        self.len = sum(part.length for part in self._parts) + len(self._closing)
+
+        self.sent = 0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self._buffer = bytearray()
+        self._chunks = self._iter_chunks()
+
+    def _header(self, name: str, filename: Optional[str] = None, content_type: Optional[str] = None,
+                headers: Optional[Mapping[str, str]] = None) -> bytes:
+        disposition = f'form-data; name="{_quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{_quote(filename)}"'
+        lines = [f'--{self.boundary}', f'Content-Disposition: {disposition}']
+        if content_type:
+            lines.append(f'Content-Type: {content_type}')
+        lines.extend(f'{key}: {value}' for key, value in (headers or {}).items())
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode()
+
+    @staticmethod
+    def _source(value: Any) -> Tuple[Any, int]:
+        if isinstance(value, Path):
+            return value, value.stat().st_size
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        if isinstance(value, (bytes, bytearray)):
+            return bytes(value), len(value)
+        try:
+            remaining = os.fstat(value.fileno()).st_size - value.tell()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            position = value.tell()
+            remaining = value.seek(0, io.SEEK_END) - position
+            value.seek(position)
+        return value, remaining
+
+    def _field_part(self, name: str, value: Any) -> _Part:
+        source, size = self._source(value if isinstance(value, (bytes, bytearray)) else str(value))
+        return _Part(self._header(name), source, size)
+
+    def _file_part(self, name: str, value: Any) -> _Part:
+        filename, content_type, headers = None, None, None
+        if isinstance(value, (tuple, list)):
+            filename, value, *rest = value
+            content_type = rest[0] if rest else None
+            headers = rest[1] if len(rest) > 1 else None
+        elif isinstance(value, Path):
+            filename = value.name
+        else:
+            filename = os.path.basename(getattr(value, 'name', '') or '') or name
+        if filename and not content_type:
+            content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        source, size = self._source(value)
+        return _Part(self._header(name, filename, content_type, headers), source, size)
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        for part in self._parts:
+            yield from part.chunks(self.chunk_size)
+        yield self._closing
+
+    def _progress(self, size: int) -> None:
+        if self.started is None:
+            self.started = time.perf_counter()
+        previous_tenth = self.sent * 10 // self.len
+        self.sent += size
+        if self.on_progress:
+            self.on_progress(self.sent, self.len)
+        if self.sent * 10 // self.len > previous_tenth:
+            logger.debug(f'Uploaded {self.sent}/{self.len} bytes')
+        if self.sent == self.len:
+            self.finished = time.perf_counter()
+            elapsed = self.finished - self.started
+            logger.info(f'Uploaded {self.len} bytes in {elapsed:.2f}s ({self.len / max(elapsed, 1e-9) / 1e6:.1f} MB/s)')
+
+    def digest(self) -> str:
+        """
+        Returns a SHA-256 of the fields, headers and contents of the parts, independent of the random boundary,
+        e.g. to fingerprint the request in a cassette. File objects are read and rewound.
+        """
+        digest = hashlib.sha256()
+        boundary = f'--{self.boundary}'.encode()
+        for part in self._parts:
+            digest.update(part.header.replace(boundary, b'--'))
+            part.rewind()
+            for chunk in part.content(self.chunk_size):
+                digest.update(chunk)
+            part.rewind()
+        return digest.hexdigest()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Returns the next bytes of the body, at most size of them unless size is negative.
+        """
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        size = len(self._buffer) if size < 0 else size
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        if data:
+            self._progress(len(data))
+        return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(lambda: self.read(self.chunk_size), b'')
+
+    def __len__(self) -> int:
+        return self.len
+
+    def tell(self) -> int:
+        """
+        Returns the number of bytes read so far.
+        """
+        return self.sent
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Rewinds the body, so a retried or redirected request sends it again. Only seek(0) is supported.
+        """
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation('MultipartEncoder can only be rewound to the start')
+        for part in self._parts:
+            part.rewind()
+        self.sent = 0
+        self.started = self.finished = None
+        self._buffer = bytearray()
+        self._chunks = self._iter_chunks()
+        return 0
@@ -0,0 +1,221 @@
+import json
+from datetime import timedelta
+from email.message import Message
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union, Mapping
+
+import requests
+from pydantic import BaseModel, parse_obj_as
+from requests import PreparedRequest
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+CHUNK_SIZE = 64 * 1024
+
+UTF8 = ('utf-8', 'utf8')
+
+
+def charset_from_headers(headers: Mapping[str, str]) -> Optional[str]:
+    """
+    Returns the charset declared in the Content-Type header, if any.
+
+    Unlike requests.utils.get_encoding_from_headers it does not fall back to ISO-8859-1 for text/*,
+    so an undeclared charset stays None and requests sniffs it only when Response.text is accessed.
+
+    Args:
+        headers (Mapping[str, str]): The response headers.
+
+    Returns:
+        Optional[str]: The declared charset, or None.
+
+    Example:
+        >>> charset_from_headers({'Content-Type': 'application/json; charset=GBK'})
+        'GBK'
+        >>> charset_from_headers({'Content-Type': 'text/html'})
+    """
+    content_type = headers.get('Content-Type')
+    if not content_type:
+        return None
+    message = Message()
+    message['Content-Type'] = content_type
+    return message.get_param('charset')
+
+
+def build_response(
+        request: PreparedRequest,
+        *,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        url: str
+) -> requests.Response:
+    """
+    Builds a fully read requests.Response from stored parts, e.g. a cache entry or a cassette record.
+
+    Args:
+        request (PreparedRequest): The request the response answers.
+        status_code (int): The HTTP status code.
+        headers (Mapping[str, str]): The response headers.
+        content (bytes): The response body.
+        url (str): The final URL of the response.
+
+    Returns:
+        requests.Response: The response, usable with res.json(), res.text and iter_chunks.
+
+    Example:
+        >>> res = build_response(prepped, status_code=200, headers={}, content=b'{}', url=prepped.url)
+        >>> res.json()
+        {}
+    """
+    res = requests.Response()
+    res.status_code = status_code
+    res.headers = CaseInsensitiveDict(headers)
+    res._content = content
+    res._content_consumed = True
+    res.url = url
+    res.request = request
+    try:
+        res.reason = HTTPStatus(status_code).phrase
+    except ValueError:
+        res.reason = ''
+    res.elapsed = timedelta(0)
+    return res
+
+
+def memoize_json(res: requests.Response) -> requests.Response:
+    """
+    Makes res.json() parse the body only once, with orjson when it is installed.
+
+    UTF-8 bodies are decoded straight from bytes. Calls with keyword arguments, or bodies
+    the fast decoder rejects, fall back to requests' own decoding and errors.
+
+    Args:
+        res (requests.Response): A fully read response.
+
+    Returns:
+        requests.Response: The same response.
+
+    Example:
+        >>> res = memoize_json(res)
+        >>> res.json() is res.json()
+        True
+    """
+    parsed = []
+
+    def json_(**kwargs) -> Any:
+        if kwargs:
+            return requests.Response.json(res, **kwargs)
+        if not parsed:
+            encoding = (res.encoding or 'utf-8').lower()
+            try:
+                parsed.append(_loads(res.content if encoding in UTF8 else res.text))
+            except ValueError:
+                parsed.append(requests.Response.json(res))
+        return parsed[0]
+
+    res.json = json_
+    return res
+
+
+def parse_model(model: Any, data: Any) -> Any:
+    """
+    Validates decoded JSON against a response model.
+
+    Args:
+        model (Any): A pydantic model, or a type such as List[Model].
+        data (Any): The decoded JSON.
+
+    Returns:
+        Any: The validated model instance.
+
+    Raises:
+        pydantic.ValidationError: If the data does not match the model.
+
+    Example:
+        >>> parse_model(List[User], [{'id': 1, 'name': 'John'}])
+        [User(id=1, name='John')]
+    """
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return model.parse_obj(data)
+    return parse_obj_as(model, data)
+
+
+def iter_chunks(res: requests.Response, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yields the body of a response in chunks and releases the connection when done.
+
+    With a response of an HttpDecorator(stream=True) endpoint the body is read from the socket
+    chunk by chunk, so memory stays bounded by chunk_size.
+
+    Args:
+        res (requests.Response): The response to read.
+        chunk_size (int, optional): Maximum size of a chunk in bytes. Defaults to CHUNK_SIZE.
+
+    Returns:
+        Iterator[bytes]: The body chunks.
+
+    Example:
+        >>> total = sum(len(chunk) for chunk in iter_chunks(api.export_report()))
+    """
+    try:
+        yield from res.iter_content(chunk_size=chunk_size)
+    finally:
+        res.close()
+
+
+def pipe_to(
+        res: requests.Response,
+        consumer: Callable[[bytes], object],
+        chunk_size: int = CHUNK_SIZE
+) -> int:
+    """
+    Feeds the body of a response chunk by chunk to a consumer.
+
+    Args:
+        res (requests.Response): The response to read.
+        consumer (Callable[[bytes], object]): Called with every chunk, e.g. hashlib's update.
+        chunk_size (int, optional): Maximum size of a chunk in bytes. Defaults to CHUNK_SIZE.
+
+    Returns:
+        int: The number of bytes consumed.
+
+    Example:
+        >>> digest = hashlib.sha256()
+        >>> pipe_to(api.export_report(), digest.update)
+        52428800
+    """
+    size = 0
+    for chunk in iter_chunks(res, chunk_size):
+        consumer(chunk)
+        size += len(chunk)
+    return size
+
+
+def save_to(
+        res: requests.Response,
+        path: Union[str, Path],
+        chunk_size: int = CHUNK_SIZE
+) -> int:
+    """
+    Writes the body of a response to a file chunk by chunk.
+
+    Args:
+        res (requests.Response): The response to read.
+        path (Union[str, Path]): The file to write.
+        chunk_size (int, optional): Maximum size of a chunk in bytes. Defaults to CHUNK_SIZE.
+
+    Returns:
+        int: The number of bytes written.
+
+    Example:
+        >>> save_to(api.export_report(), 'report.xlsx')
+        52428800
+    """
+    with open(path, 'wb') as f:
+        return pipe_to(res, f.write, chunk_size)
@@ -0,0 +1,207 @@
+import random
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple, Type
+
+import requests
+from loguru import logger
+from requests import RequestException, ConnectionError, Timeout
+
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE')
+
+RETRY_STATUSES = (502, 503, 504)
+
+
+class CircuitOpen(RequestException):
+    """
+    Raised without sending the request while the circuit of its host is open.
+    """
+
+
+class RetryPolicy:
+    """
+    Retries failed calls with exponential backoff and jitter.
+
+    A call is retried when it raises one of exceptions or answers with one of statuses,
+    and only if its method is idempotent, unless retry_non_idempotent is set or the request
+    carries an Idempotency-Key header. A Retry-After header in seconds overrides the backoff.
+
+    Args:
+        attempts (int, optional): Maximum number of attempts, the first one included. Defaults to 3.
+        statuses (Iterable[int], optional): Statuses that are retried. Defaults to RETRY_STATUSES.
+        exceptions (Tuple[Type[Exception], ...], optional): Exceptions that are retried. Defaults to (ConnectionError, Timeout).
+        backoff (float, optional): Delay before the first retry in seconds, doubled for every next one. Defaults to 0.5.
+        max_backoff (float, optional): Upper bound of a delay in seconds. Defaults to 10.
+        jitter (float, optional): Fraction of a delay randomized to spread retries of parallel tests. Defaults to 0.5.
+        retry_non_idempotent (bool, optional): Whether POST/PATCH are retried too. Defaults to False.
+
+    Example:
+        >>> gateway = RetryPolicy(attempts=4, statuses=(502, 503))
+        >>>
+        >>> @HttpDecorator(url='/users', retry=gateway)
+        ... def list_users(self):
+        ...     pass
+    """
+
+    def __init__(
+            self,
+            *,
+            attempts: int = 3,
+            statuses: Iterable[int] = RETRY_STATUSES,
+            exceptions: Tuple[Type[Exception], ...] = (ConnectionError, Timeout),
+            backoff: float = 0.5,
+            max_backoff: float = 10.0,
+            jitter: float = 0.5,
+            retry_non_idempotent: bool = False
+    ) -> None:
+        self.attempts = max(1, attempts)
+        self.statuses = frozenset(statuses)
+        self.exceptions = exceptions
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def allows(self, request: requests.PreparedRequest) -> bool:
+        """
+        Returns whether the request may be sent more than once.
+        """
+        return (
+                self.retry_non_idempotent
+                or request.method in IDEMPOTENT_METHODS
+                or 'Idempotency-Key' in request.headers
+        )
+
+    def delay(self, attempt: int, res: Optional[requests.Response] = None) -> float:
+        """
+        Returns the seconds to wait before the given retry, counted from 1.
+        """
+        retry_after = res.headers.get('Retry-After', '') if res is not None else ''
+        if retry_after.isdigit():
+            return min(self.max_backoff, float(retry_after))
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def call(
+            self,
+            request: requests.PreparedRequest,
+            fetch: Callable[[], requests.Response]
+    ) -> requests.Response:
+        """
+        Fetches the response of a request, retrying as the policy allows.
+
+        Args:
+            request (requests.PreparedRequest): The request being sent.
+            fetch (Callable[[], requests.Response]): Sends the request once.
+
+        Returns:
+            requests.Response: The first response not retried, possibly a failed one once attempts run out.
+        """
+        attempts = self.attempts if self.allows(request) else 1
+
+        for attempt in range(1, attempts + 1):
+            last = attempt == attempts
+            try:
+                res = fetch()
+            except CircuitOpen:
+                raise
+            except self.exceptions as e:
+                if last:
+                    raise
+                reason, res = e.__class__.__name__, None
+            else:
+                if last or res.status_code not in self.statuses:
+                    return res
+                reason = f'HTTP {res.status_code}'
+                res.close()
+
+            delay = self.delay(attempt, res)
+            logger.warning(f'{request.method} {request.url} failed with {reason}, retry {attempt} in {delay:.2f}s')
+            time.sleep(delay)
+            if hasattr(request.body, 'seek'):
+                request.body.seek(0)
+
+
+class CircuitBreaker:
+    """
+    Fails fast for a host that is clearly down, instead of every test waiting out its own timeouts.
+
+    After failure_threshold consecutive failures of a host its circuit opens and calls raise CircuitOpen
+    without a request. Once reset_timeout has passed one trial call is let through: success closes the circuit,
+    failure opens it again. A failure is a connection error, a timeout or one of statuses.
+
+    Args:
+        failure_threshold (int, optional): Consecutive failures opening the circuit. Defaults to 5.
+        reset_timeout (float, optional): Seconds before a trial call is let through. Defaults to 30.
+        statuses (Iterable[int], optional): Statuses counted as failures. Defaults to RETRY_STATUSES.
+
+    Example:
+        >>> staging = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        >>>
+        >>> @HttpDecorator(url='/users', retry=RetryPolicy(), breaker=staging)
+        ... def list_users(self):
+        ...     pass
+    """
+
+    def __init__(
+            self,
+            *,
+            failure_threshold: int = 5,
+            reset_timeout: float = 30.0,
+            statuses: Iterable[int] = RETRY_STATUSES
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.statuses = frozenset(statuses)
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def is_open(self, host: str) -> bool:
+        """
+        Returns whether calls to the host are currently refused.
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return False
+            if time.monotonic() - opened_at >= self.reset_timeout:
+                self._opened_at[host] = time.monotonic()
+                return False
+            return True
+
+    def _record(self, host: str, failed: bool) -> None:
+        with self._lock:
+            if not failed:
+                self._failures.pop(host, None)
+                self._opened_at.pop(host, None)
+                return
+            self._failures[host] = self._failures.get(host, 0) + 1
+            if self._failures[host] >= self.failure_threshold:
+                if host not in self._opened_at:
+                    logger.error(f'Circuit of {host} opened after {self._failures[host]} consecutive failures')
+                self._opened_at[host] = time.monotonic()
+
+    def call(self, host: str, fetch: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Fetches a response unless the circuit of the host is open, and records the outcome.
+
+        Args:
+            host (str): The host the request goes to.
+            fetch (Callable[[], requests.Response]): Sends the request once.
+
+        Returns:
+            requests.Response: The response.
+
+        Raises:
+            CircuitOpen: If the circuit of the host is open.
+        """
+        if self.is_open(host):
+            raise CircuitOpen(f'Circuit of {host} is open, failing fast')
+        try:
+            res = fetch()
+        except (ConnectionError, Timeout):
+            self._record(host, failed=True)
+            raise
+        self._record(host, failed=res.status_code in self.statuses)
+        return res
@@ -0,0 +1,293 @@
+import base64
+import gzip
+import json
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+
+Handler = Callable[..., Any]
+
+SKIPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection')
+
+_active: Optional['StandInServer'] = None
+
+_MISSING = object()
+_PLACEHOLDER = re.compile(r'{(\w+)}')
+
+
+class StandInRequest:
+    """
+    A request received by a StandInServer.
+
+    Attributes:
+        method (str): The HTTP method.
+        path (str): The path without the query string.
+        params (Dict[str, List[str]]): The query parameters.
+        headers (Dict[str, str]): The request headers.
+        body (bytes): The request body.
+    """
+
+    def __init__(self, *, method: str, path: str, params: Dict[str, List[str]], headers: Dict[str, str], body: bytes):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        """
+        Returns the body decoded as JSON.
+        """
+        return json.loads(self.body)
+
+
+def _to_response(result: Any) -> Tuple[int, Dict[str, str], bytes]:
+    status, headers = 200, {}
+    if isinstance(result, tuple):
+        status, result, *rest = result
+        headers = dict(rest[0]) if rest else {}
+    if result is None:
+        return (204 if status == 200 else status), headers, b''
+    if isinstance(result, str):
+        headers.setdefault('Content-Type', 'text/plain; charset=utf-8')
+        return status, headers, result.encode('utf-8')
+    if isinstance(result, (bytes, bytearray)):
+        headers.setdefault('Content-Type', 'application/octet-stream')
+        return status, headers, bytes(result)
+    headers.setdefault('Content-Type', 'application/json')
+    return status, headers, json.dumps(result).encode('utf-8')
+
+
+def _compile(path: str) -> re.Pattern:
+    parts = _PLACEHOLDER.split(path)
+    return re.compile(''.join(
+        f'(?P<{part}>[^/]+)' if i % 2 else re.escape(part)
+        for i, part in enumerate(parts)
+    ) + '$')
+
+
+def _load_interactions(path: Union[str, Path]) -> Dict[Tuple[str, str], List[dict]]:
+    interactions = defaultdict(list)
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            interaction = json.loads(line)
+            split = urlsplit(interaction['request_url'])
+            target = f'{split.path}?{split.query}' if split.query else split.path
+            interactions[(interaction['method'], target)].append(interaction)
+    return interactions
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _handle(self) -> None:
+        self.server.stand_in.serve(self)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = _handle
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class StandInServer:
+    """
+    An in-process HTTP server standing in for the backend of HttpDecorator endpoints.
+
+    Responses come from route handlers, then from a cassette recorded with use_cassette, else 404.
+    Every request may be delayed by latency plus a random jitter, and fail with error_status, or with
+    a dropped connection if error_status is None, at error_rate. Connections are kept alive, so pooling,
+    retries and concurrency of the client stack behave as against a real server.
+
+    While the server is entered as a context manager every HttpDecorator URL is rebased onto it,
+    whatever base_url the endpoint class declares.
+
+    Args:
+        cassette (Union[str, Path, None], optional): A cassette file whose responses are served by method, path and query. Defaults to None.
+        latency (float, optional): Seconds every response is delayed. Defaults to 0.
+        jitter (float, optional): Upper bound of a random extra delay in seconds. Defaults to 0.
+        error_rate (float, optional): Share of requests failing, from 0 to 1. Defaults to 0.
+        error_status (Optional[int], optional): Status of failed requests, None to drop the connection. Defaults to 503.
+        seed (Optional[int], optional): Seed of the injected randomness, for reproducible runs. Defaults to None.
+
+    Example:
+        >>> with StandInServer(latency=0.02) as server:
+        ...     server.route('GET', '/users', [{'id': 1, 'name': 'John'}])
+        ...
+        ...     @server.route('GET', '/users/{user_id}')
+        ...     def get_user(request, user_id):
+        ...         return {'id': int(user_id)}
+        ...
+        ...     UserApi().get_user(1).json()
+        {'id': 1}
+    """
+
+    def __init__(
+            self,
+            *,
+            cassette: Union[str, Path, None] = None,
+            latency: float = 0.0,
+            jitter: float = 0.0,
+            error_rate: float = 0.0,
+            error_status: Optional[int] = 503,
+            seed: Optional[int] = None
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.received: List[StandInRequest] = []
+        self._routes: Dict[Tuple[str, str], Handler] = {}
+        self._patterns: List[Tuple[str, re.Pattern, Handler]] = []
+        self._interactions = _load_interactions(cassette) if cassette else {}
+        self._played: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._previous: Optional[StandInServer] = None
+
+    def route(self, method: str, path: str, response: Any = _MISSING) -> Any:
+        """
+        Registers the response of a method and path, or decorates its handler.
+
+        A path may hold {name} placeholders, passed to the handler as keyword arguments.
+        A handler takes the StandInRequest and returns a body, or a (status, body[, headers]) tuple.
+        A dict or list body is sent as JSON, str as text, bytes as is and None as no content.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The path, e.g. '/users/{user_id}'.
+            response (Any, optional): A static response in the form a handler returns.
+
+        Returns:
+            Any: The decorator, or None with a static response.
+        """
+        if response is not _MISSING:
+            self.route(method, path)(lambda request, **_: response)
+            return None
+
+        def decorator(handler: Handler) -> Handler:
+            if _PLACEHOLDER.search(path):
+                self._patterns.append((method.upper(), _compile(path), handler))
+            else:
+                self._routes[(method.upper(), path)] = handler
+            return handler
+
+        return decorator
+
+    def _respond(self, request: StandInRequest, target: str) -> Tuple[int, Dict[str, str], bytes]:
+        handler = self._routes.get((request.method, request.path))
+        if handler is not None:
+            return _to_response(handler(request))
+        for method, pattern, handler in self._patterns:
+            match = pattern.match(request.path) if method == request.method else None
+            if match:
+                return _to_response(handler(request, **match.groupdict()))
+
+        interactions = self._interactions.get((request.method, target))
+        if interactions:
+            with self._lock:
+                played = self._played[(request.method, target)]
+                self._played[(request.method, target)] = played + 1
+            interaction = interactions[min(played, len(interactions) - 1)]
+            headers = {k: v for k, v in interaction['headers'].items() if k.lower() not in SKIPPED_HEADERS}
+            return interaction['status_code'], headers, base64.b64decode(interaction['content'])
+
+        return _to_response((404, {'error': f'No stand-in route for {request.method} {target}'}))
+
+    def serve(self, handler: BaseHTTPRequestHandler) -> None:
+        """
+        Answers one request, called by the handler threads of the server.
+        """
+        length = int(handler.headers.get('Content-Length') or 0)
+        split = urlsplit(handler.path)
+        request = StandInRequest(
+            method=handler.command,
+            path=split.path,
+            params=parse_qs(split.query),
+            headers=dict(handler.headers),
+            body=handler.rfile.read(length) if length else b'',
+        )
+        with self._lock:
+            self.received.append(request)
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+
+        if delay:
+            time.sleep(delay)
+        if failed and self.error_status is None:
+            handler.close_connection = True
+            return
+
+        try:
+            status, headers, content = (self.error_status, {}, b'') if failed else self._respond(request, handler.path)
+        except Exception as e:
+            status, headers, content = _to_response((500, {'error': repr(e)}))
+
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header('Content-Length', str(len(content)))
+        handler.end_headers()
+        if request.method != 'HEAD':
+            handler.wfile.write(content)
+
+    @property
+    def url(self) -> str:
+        """
+        The base URL of the running server, e.g. 'http://127.0.0.1:50123'.
+        """
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def rebase(self, url: str) -> str:
+        """
+        Returns the URL with its scheme and host replaced by those of the server.
+        """
+        split = urlsplit(url)
+        return urlunsplit(('http', urlsplit(self.url).netloc, split.path, split.query, split.fragment))
+
+    def start(self) -> 'StandInServer':
+        """
+        Starts serving on a free local port in a background thread.
+        """
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops serving and closes the listening socket.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'StandInServer':
+        global _active
+
+        self.start()
+        self._previous, _active = _active, self
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global _active
+
+        _active, self._previous = self._previous, None
+        self.stop()
+
+
+def current() -> Optional[StandInServer]:
+    """
+    Returns the server every HttpDecorator URL is currently rebased onto, if any.
+    """
+    return _active
@@ -0,0 +1,215 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+from selenite.conf.allure.report import StepContext
+
+PHASES = ('prepare', 'acquire', 'connect', 'ttfb', 'transfer', 'total')
+
+enabled = False
+
+_current = threading.local()
+_lock = threading.Lock()
+_samples: Dict[str, List['RequestTiming']] = defaultdict(list)
+
+
+class RequestTiming:
+    """
+    Timing breakdown of one request, every phase in seconds.
+
+    Attributes:
+        endpoint (str): The decorated endpoint, e.g. 'GET UserApi.get_user'.
+        prepare (float): Calling the decorated function and preparing the request.
+        acquire (float): Getting a connection from the pool, excluding connect.
+        connect (float): Opening the TCP/TLS connection, 0 for a reused one.
+        new_connection (bool): Whether a new connection was opened.
+        ttfb (float): From sending the request until the response headers arrived, connect included.
+        transfer (float): Downloading the body.
+        total (float): All of the above.
+    """
+
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint = endpoint
+        self.prepare = 0.0
+        self.acquire = 0.0
+        self.connect = 0.0
+        self.new_connection = False
+        self.ttfb = 0.0
+        self.transfer = 0.0
+        self.total = 0.0
+
+    def to_params(self) -> Dict[str, str]:
+        """
+        Returns the phases formatted as Allure step parameters.
+        """
+        params = {phase: f'{getattr(self, phase) * 1000:.1f} ms' for phase in PHASES}
+        params['connection'] = 'new' if self.new_connection else 'reused'
+        return params
+
+
+class _TimedPoolMixin:
+    """
+    Records connection acquisition and connect time into the RequestTiming of the current thread, if any.
+    """
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        connect = conn.connect
+
+        def timed_connect():
+            sample = getattr(_current, 'timing', None)
+            start = time.perf_counter()
+            try:
+                return connect()
+            finally:
+                if sample is not None:
+                    sample.connect += time.perf_counter() - start
+
+        conn.connect = timed_connect
+        return conn
+
+    def _get_conn(self, timeout=None):
+        sample = getattr(_current, 'timing', None)
+        if sample is None:
+            return super()._get_conn(timeout)
+        start = time.perf_counter()
+        conn = super()._get_conn(timeout)
+        sample.acquire += time.perf_counter() - start
+        sample.new_connection = getattr(conn, 'sock', None) is None
+        return conn
+
+
+class TimedHTTPConnectionPool(_TimedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class TimedHTTPSConnectionPool(_TimedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter whose pools report connection acquisition and connect time.
+
+    When no request is being timed the pools behave as the default ones,
+    the only cost is one thread-local lookup per connection acquisition.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+
+def measure(
+        endpoint: str,
+        started: float,
+        fetch: Callable[[], requests.Response],
+        *,
+        read_body: bool = True
+) -> requests.Response:
+    """
+    Fetches a response while timing its phases, records the sample and reports it as an Allure step.
+
+    Args:
+        endpoint (str): The decorated endpoint the sample is aggregated under.
+        started (float): time.perf_counter() at the start of the call, before the decorated function ran.
+        fetch (Callable[[], requests.Response]): Sends the prepared request with stream=True.
+        read_body (bool, optional): Whether to download the body here, timed as transfer. Defaults to True.
+
+    Returns:
+        requests.Response: The fetched response.
+    """
+    sample = RequestTiming(endpoint)
+    sample.prepare = time.perf_counter() - started
+
+    _current.timing = sample
+    try:
+        res = fetch()
+    finally:
+        _current.timing = None
+
+    sample.ttfb = res.elapsed.total_seconds()
+    if read_body:
+        transfer_start = time.perf_counter()
+        res.content
+        sample.transfer = time.perf_counter() - transfer_start
+    sample.total = time.perf_counter() - started
+
+    with _lock:
+        _samples[endpoint].append(sample)
+    with StepContext(f'{endpoint} timing', sample.to_params()):
+        pass
+
+    return res
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def summary() -> Dict[str, dict]:
+    """
+    Aggregates the recorded samples per endpoint: count, share of new connections, mean and p95 of every phase.
+
+    Returns:
+        Dict[str, dict]: The summary per endpoint.
+
+    Example:
+        >>> summary()
+        {'GET UserApi.get_user': {'count': 12, 'new_connections': 0.08, 'ttfb': {'mean': 0.041, 'p95': 0.09}, ...}}
+    """
+    with _lock:
+        samples = {endpoint: list(items) for endpoint, items in _samples.items()}
+
+    return {
+        endpoint: {
+            'count': len(items),
+            'new_connections': sum(item.new_connection for item in items) / len(items),
+            **{
+                phase: {
+                    'mean': sum(getattr(item, phase) for item in items) / len(items),
+                    'p95': _percentile([getattr(item, phase) for item in items], 95),
+                }
+                for phase in PHASES
+            },
+        }
+        for endpoint, items in samples.items()
+    }
+
+
+def dump(path: Union[str, Path]) -> None:
+    """
+    Writes the per-endpoint summary to a JSON file, e.g. from pytest_sessionfinish.
+
+    Example:
+        >>> def pytest_sessionfinish(session):
+        ...     timing.dump('reports/api_timing.json')
+    """
+    Path(path).write_text(json.dumps(summary(), indent=2))
+
+
+def reset() -> None:
+    """
+    Drops every recorded sample.
+    """
+    with _lock:
+        _samples.clear()
+
+
+def enable(value: Optional[bool] = True) -> None:
+    """
+    Turns timing on, or off with False, for every HttpDecorator endpoint.
+    """
+    global enabled
+    enabled = bool(value)
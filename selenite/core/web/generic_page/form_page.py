@@ -105,6 +105,9 @@ class Entity:
 class FormPage(Entity):
     """
     A class representing a generic form page on a web page.
+
+    The should_* methods re-read the table until it matches or the Selene timeout passes,
+    through web_assert, so inside web_assert.soft() their failures are collected.
     """
     def get_row_attribute_by_index(self, index: int, attribute: str) -> str:
         """
@@ -161,7 +164,10 @@ class FormPage(Entity):
             >>> should_contain_sub_dictionary({'header1': 'value1', 'header2': 'value2'})
             FormPage(...)
         """
-        web_assert.is_true(bool(self.matching_dictionaries_in_table_by_dictionary(dictionary)))
+        web_assert.eventually(
+            lambda: bool(self.matching_dictionaries_in_table_by_dictionary(dictionary)),
+            f'Table should contain a row matching {dictionary}'
+        )
         return self
 
     def should_not_contain_sub_dictionary(self, dictionary: dict) -> FormPage:
@@ -178,7 +184,10 @@ class FormPage(Entity):
             >>> should_not_contain_sub_dictionary({'header1': 'value1', 'header2': 'value2'})
             FormPage(...)
         """
-        web_assert.is_false(self.matching_dictionaries_in_table_by_dictionary(dictionary))
+        web_assert.eventually(
+            lambda: not self.matching_dictionaries_in_table_by_dictionary(dictionary),
+            f'Table should not contain a row matching {dictionary}'
+        )
         return self
 
     def should_contain_sub_list(self, lst: list) -> FormPage:
@@ -195,7 +204,10 @@ class FormPage(Entity):
             >>> should_contain_sub_list(['value1', 'value2'])
             FormPage(...)
         """
-        web_assert.is_true(bool(self.matching_lists_in_table_by_list(lst)))
+        web_assert.eventually(
+            lambda: bool(self.matching_lists_in_table_by_list(lst)),
+            f'Table should contain a row matching {lst}'
+        )
         return self
 
     def should_have_text(self, text: str) -> FormPage:
@@ -212,7 +224,7 @@ class FormPage(Entity):
             >>> should_have_text('text')
             FormPage(...)
         """
-        self.tbody.by(have.text(text)).should(have.size_greater_than_or_equal(1))
+        web_assert.should(self.tbody.by(have.text(text)), have.size_greater_than_or_equal(1))
         return self
 
     def should_have_text_by_index(self, index: int, text: str) -> FormPage:
@@ -230,7 +242,7 @@ class FormPage(Entity):
             >>> should_have_text_by_index(0, 'text')
             FormPage(...)
         """
-        self.tbody.element(index).should(have.text(text))
+        web_assert.should(self.tbody.element(index), have.text(text))
         return self
 
     def should_have_row_attribute(self, row_keyword: Union[str, list], attribute: str, value: str) -> FormPage:
@@ -249,8 +261,20 @@ class FormPage(Entity):
             >>> should_have_row_attribute('keyword', 'header1', 'value1')
             FormPage(...)
         """
-        text = self.get_row_attribute_by_text(row_keyword, attribute)
-        web_assert.is_equal(text, value)
+        observed = ['not found']
+
+        def has_value() -> bool:
+            try:
+                observed[0] = self.get_row_attribute_by_text(row_keyword, attribute)
+            except Exception as error:
+                observed[0] = f'not found ({error.__class__.__name__}: {error})'
+                raise
+            return observed[0] == value
+
+        web_assert.eventually(
+            has_value,
+            lambda: f'Row {row_keyword} should have {attribute} {value}, actual value {observed[0]}'
+        )
         return self
 
 
@@ -0,0 +1,35 @@
+from typing import Optional
+
+from selene import Config, browser
+
+from selenite.conf.settings.project.selene import SeleneSettings
+from selenite.core.web.selene import polling
+
+
+def browser_config_settings(setting: SeleneSettings, config: Optional[Config] = None) -> Config:
+    """
+    Applies SeleneSettings to a Selene config: base url, timeout, window size, failure artifacts
+    and the polling_* settings of its waits.
+
+    Args:
+        setting: The settings to apply.
+        config: The config to update, browser.config if None.
+
+    Returns:
+        The updated config.
+
+    Example:
+        >>> browser_config_settings(SeleneSettings.in_context('.env'))
+    """
+    config = config or browser.config
+
+    config.base_url = setting.base_url
+    config.timeout = setting.timeout
+    if not setting.maximize_window:
+        config.window_width = setting.window_width
+        config.window_height = setting.window_height
+    config.hold_driver_at_exit = setting.hold_browser_open
+    config.save_screenshot_on_failure = setting.save_screenshot_on_failure
+    config.save_page_source_on_failure = setting.save_page_source_on_failure
+    config._build_wait_strategy = polling.wait_strategy(setting)
+    return config
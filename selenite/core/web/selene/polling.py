@@ -0,0 +1,199 @@
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from selene.common.fp import identity
+from selene.core.exceptions import TimeoutException
+from selene.core.wait import Wait
+
+from selenite.conf.settings.project.selene import SeleneSettings
+
+_lock = threading.Lock()
+_counts = {'waits': 0, 'polls': 0}
+
+MUTATION_SCRIPT = """
+var seen = arguments[0], done = arguments[arguments.length - 1];
+var state = window.__seleniteMutations;
+if (state && state.count !== seen) {
+    return done(state.count);
+}
+if (!state) {
+    state = window.__seleniteMutations = {count: 0, waiting: null};
+    new MutationObserver(function () {
+        state.count += 1;
+        if (state.waiting) {
+            state.waiting();
+        }
+    }).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+var timer = setTimeout(function () {
+    state.waiting = null;
+    done(state.count);
+}, arguments[1]);
+state.waiting = function () {
+    state.waiting = null;
+    clearTimeout(timer);
+    done(state.count);
+};
+"""
+
+
+def intervals(settings: SeleneSettings) -> Iterator[float]:
+    """
+    Returns the pauses between polls of one wait, in seconds.
+
+    Args:
+        settings: The polling_* settings to use.
+
+    Returns:
+        An endless iterator of pauses:
+            fixed - polling_interval every time;
+            backoff - polling_interval growing by polling_backoff_factor up to polling_max_interval;
+            fast_start - polling_fast_start pauses of a tenth of polling_interval, then backoff;
+            mutation - polling_max_interval, the longest pause until the next DOM mutation.
+
+    Example:
+        >>> list(itertools.islice(intervals(SeleneSettings.construct(polling_strategy='backoff')), 5))
+        [0.1, 0.2, 0.4, 0.8, 1.0]
+    """
+    if settings.polling_strategy == 'fixed':
+        return itertools.repeat(settings.polling_interval)
+    if settings.polling_strategy == 'mutation':
+        return itertools.repeat(settings.polling_max_interval)
+
+    def backoff() -> Iterator[float]:
+        interval = settings.polling_interval
+        while True:
+            yield min(interval, settings.polling_max_interval)
+            interval *= settings.polling_backoff_factor
+
+    if settings.polling_strategy == 'fast_start':
+        return itertools.chain(
+            itertools.repeat(settings.polling_interval / 10, settings.polling_fast_start), backoff()
+        )
+    return backoff()
+
+
+class PollingWait(Wait):
+    """
+    Selene Wait pausing between polls by a polling strategy instead of polling continuously.
+
+    With the mutation strategy a pause ends early on the first DOM mutation of the page,
+    awaited in the browser by one execute_async_script call per pause. The script leaves an observer
+    counting mutations on the page, and returns at once if the count changed since the previous pause,
+    so mutations made while a condition was checked are not missed. Conditions are Python callables,
+    so they can not be checked inside the script itself. Trade-offs: mutations made during the first
+    poll on a page, before its observer is installed, are not seen, and the first pause of a wait
+    ends at once if the page mutated since the observer was installed, costing one extra poll.
+    """
+
+    def __init__(
+            self,
+            entity: Any,
+            at_most: float,
+            or_fail_with: Optional[Callable[[TimeoutException], Exception]] = None,
+            _decorator: Callable[[Wait], Callable[[Callable[..., Any]], Callable[..., Any]]] = lambda _: identity,
+            settings: Optional[SeleneSettings] = None,
+            driver: Optional[Callable[[], Any]] = None,
+    ):
+        super().__init__(entity, at_most, or_fail_with, _decorator)
+        self.settings = settings or SeleneSettings.construct()
+        self.driver = driver
+        self._seen: Optional[int] = None
+
+    def at_most(self, timeout: float) -> Wait:
+        return PollingWait(
+            self.entity, timeout, self._hook_failure, self._decorator, settings=self.settings, driver=self.driver
+        )
+
+    def or_fail_with(self, hook_failure: Optional[Callable[[TimeoutException], Exception]]) -> Wait:
+        return PollingWait(
+            self.entity, self._timeout, hook_failure, self._decorator, settings=self.settings, driver=self.driver
+        )
+
+    def _pause(self, seconds: float) -> None:
+        if self.settings.polling_strategy == 'mutation' and self.driver:
+            try:
+                self._seen = self.driver().execute_async_script(MUTATION_SCRIPT, self._seen, int(seconds * 1000))
+                return
+            except Exception:
+                pass
+        time.sleep(seconds)
+
+    def for_(self, fn: Callable[[Any], Any]) -> Any:
+        def logic(fn: Callable[[Any], Any]) -> Any:
+            finish_time = time.time() + self._timeout
+            pauses = intervals(self.settings)
+            polls = 0
+
+            try:
+                while True:
+                    polls += 1
+                    try:
+                        return fn(self.entity)
+                    except Exception as reason:
+                        left = finish_time - time.time()
+                        if left <= 0:
+                            failure = TimeoutException(
+                                f'\n'
+                                f'\nTimed out after {self._timeout}s, while waiting for:'
+                                f'\n{self.entity}.{fn}'
+                                f'\n'
+                                f'\nReason: {reason.__class__.__name__}: {reason}'
+                            )
+                            raise self._hook_failure(failure)
+                        self._pause(min(next(pauses), left))
+            finally:
+                with _lock:
+                    _counts['waits'] += 1
+                    _counts['polls'] += polls
+
+        return self._decorator(self)(logic)(fn)
+
+
+def wait_strategy(settings: SeleneSettings) -> Callable[[Any], Callable[[Any], Wait]]:
+    """
+    Build wait strategy for browser.config._build_wait_strategy, creating PollingWait
+    with the timeout, failure hooks and wait decorator of the config.
+
+    Args:
+        settings: The polling_* settings to use.
+
+    Returns:
+        A config strategy building a PollingWait for an entity.
+
+    Example:
+        >>> browser.config._build_wait_strategy = polling.wait_strategy(
+        ...     SeleneSettings(polling_strategy='backoff', polling_max_interval=0.5)
+        ... )
+        >>> # or with the other settings, by browser_config.browser_config_settings(settings)
+    """
+    return lambda config: lambda entity: PollingWait(
+        entity,
+        at_most=config.timeout,
+        or_fail_with=config._inject_screenshot_and_page_source_pre_hooks(config.hook_wait_failure),
+        _decorator=config._wait_decorator,
+        settings=settings,
+        driver=lambda: config.driver,
+    )
+
+
+def counts() -> Dict[str, int]:
+    """
+    Returns the number of PollingWait waits and the polls they spent.
+
+    Example:
+        >>> counts()
+        {'waits': 120, 'polls': 310}
+    """
+    with _lock:
+        return dict(_counts)
+
+
+def reset() -> None:
+    """
+    Resets the wait and poll counts.
+    """
+    with _lock:
+        _counts.update(waits=0, polls=0)
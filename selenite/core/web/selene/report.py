@@ -1,6 +1,8 @@
-from functools import reduce
+import weakref
 from typing import Protocol, Dict, Any, ContextManager, Iterable, Tuple, Callable
 
+from selenite.conf.python.etc import translator
+
 
 class _ContextManagerFactory(Protocol):
     def __call__(
@@ -19,32 +21,38 @@ def log_with(
 
     Args:
         context: A factory that returns a context manager.
-        translations: A list of tuples of strings to replace in the log title.
+        translations: A list of tuples of strings to replace in the log title,
+            compiled once into a single-pass translator.
 
     Returns:
         A decorator that logs function calls with the given context manager.
+        Titles are memoized per entity and command, held weakly, so each pair is formatted
+        on its first wait only, and forgotten with the entity or the command.
 
     Example:
         >>> @log_with(context=MyContextManager)
         ... def my_function():
         ...     pass
     """
+    translate = translator(translations, cache_size=0)
+    titles: 'weakref.WeakKeyDictionary[Any, weakref.WeakKeyDictionary[Any, str]]' = weakref.WeakKeyDictionary()
+
+    def title(entity: Any, fn: Any) -> str:
+        try:
+            by_fn = titles.get(entity)
+            if by_fn is None:
+                by_fn = titles[entity] = weakref.WeakKeyDictionary()
+            text = by_fn.get(fn)
+            if text is None:
+                text = by_fn[fn] = translate(f'{entity}: {fn}')
+            return text
+        except TypeError:
+            return translate(f'{entity}: {fn}')
+
     def decorator_factory(wait: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         def decorator(for_: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
             def decorated(fn: Callable[..., Any]) -> Callable[..., Any]:
-                title = f'{wait.entity}: {fn}'
-
-                def translate(initial: str, item: Tuple[str, str]) -> str:
-                    old, new = item
-                    return initial.replace(old, new)
-
-                translated_title = reduce(
-                    translate,
-                    translations,
-                    title,
-                )
-
-                with context(title=translated_title, params={}):
+                with context(title=title(wait.entity, fn), params={}):
                     return for_(fn)
 
             return decorated
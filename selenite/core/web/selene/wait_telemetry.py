@@ -0,0 +1,169 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+_lock = threading.Lock()
+_stats: Dict[Tuple[str, str], 'WaitStats'] = {}
+
+
+class WaitStats:
+    """
+    Aggregated waits of one entity for one condition or command.
+
+    Attributes:
+        entity (str): The entity description, e.g. the element locator.
+        command (str): The condition or command waited for, e.g. 'be.clickable'.
+        count (int): Number of waits.
+        total (float): Seconds spent waiting in total.
+        max (float): Longest wait in seconds.
+        polls (int): Number of polls in total, one per evaluation of the condition.
+        max_polls (int): Most polls of one wait.
+        failures (int): Number of waits that timed out or raised.
+    """
+
+    def __init__(self, entity: str, command: str) -> None:
+        self.entity = entity
+        self.command = command
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.polls = 0
+        self.max_polls = 0
+        self.failures = 0
+
+    def add(self, duration: float, polls: int, failed: bool) -> None:
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.polls += polls
+        self.max_polls = max(self.max_polls, polls)
+        self.failures += failed
+
+    def to_dict(self) -> dict:
+        return {
+            'entity': self.entity,
+            'command': self.command,
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count,
+            'max': self.max,
+            'polls': self.polls,
+            'retries': self.polls - self.count,
+            'max_polls': self.max_polls,
+            'failures': self.failures,
+        }
+
+
+class _Counted:
+    """
+    Counts the calls of a condition or command, described as the wrapped one.
+    """
+
+    def __init__(self, fn: Callable[[Any], Any]) -> None:
+        self.fn = fn
+        self.polls = 0
+
+    def __call__(self, entity: Any) -> Any:
+        self.polls += 1
+        return self.fn(entity)
+
+    def __str__(self) -> str:
+        return str(self.fn)
+
+
+def record(entity: str, command: str, duration: float, polls: int, failed: bool) -> None:
+    """
+    Records one wait.
+    """
+    with _lock:
+        stats = _stats.get((entity, command))
+        if stats is None:
+            stats = _stats[(entity, command)] = WaitStats(entity, command)
+        stats.add(duration, polls, failed)
+
+
+def recorded(
+        decorator: Optional[Callable[[Any], Callable[..., Any]]] = None
+) -> Callable[[Any], Callable[[Callable[..., Any]], Callable[..., Any]]]:
+    """
+    Wait decorator factory recording the duration, number of polls and outcome of every Selene wait,
+    optionally wrapping another wait decorator such as report.log_with.
+
+    Args:
+        decorator: A wait decorator factory to apply inside the recording one,
+            it receives the original condition or command, the polls are counted closer to the wait.
+
+    Returns:
+        A wait decorator factory for browser.config._wait_decorator.
+
+    Example:
+        >>> browser.config._wait_decorator = wait_telemetry.recorded(
+        ...     log_with(context=allure_commons._allure.StepContext)
+        ... )
+    """
+    def decorator_factory(wait: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        inner = decorator(wait) if decorator else None
+
+        def decorator_(for_: Callable[..., Any]) -> Callable[..., Any]:
+            counted: List[_Counted] = []
+
+            def counting(fn: Callable[..., Any]) -> Any:
+                counted.append(_Counted(fn))
+                return for_(counted[-1])
+
+            waiting = inner(counting) if inner else counting
+
+            def decorated(fn: Callable[..., Any]) -> Any:
+                started = time.perf_counter()
+                failed = True
+                try:
+                    result = waiting(fn)
+                    failed = False
+                    return result
+                finally:
+                    polls = counted.pop().polls if counted else 0
+                    record(str(wait.entity), str(fn), time.perf_counter() - started, polls, failed)
+
+            return decorated
+
+        return decorator_
+
+    return decorator_factory
+
+
+def summary(top: int = 10) -> Dict[str, List[dict]]:
+    """
+    Returns the entity/condition pairs that waited the longest in total and those polled the most.
+
+    Example:
+        >>> summary(top=3)['slowest'][0]
+        {'entity': "browser.element(('css selector', '#save'))", 'command': 'be.clickable', 'total': 41.2, ...}
+    """
+    with _lock:
+        stats = [item.to_dict() for item in _stats.values()]
+
+    return {
+        'slowest': sorted(stats, key=lambda item: item['total'], reverse=True)[:top],
+        'most_retried': sorted(stats, key=lambda item: item['retries'], reverse=True)[:top],
+    }
+
+
+def dump(path: Union[str, Path], top: int = 10) -> None:
+    """
+    Writes the summary to a JSON file, e.g. from pytest_sessionfinish.
+
+    Example:
+        >>> def pytest_sessionfinish(session):
+        ...     wait_telemetry.dump('reports/waits.json')
+    """
+    Path(path).write_text(json.dumps(summary(top), indent=2))
+
+
+def reset() -> None:
+    """
+    Drops every recorded wait.
+    """
+    with _lock:
+        _stats.clear()
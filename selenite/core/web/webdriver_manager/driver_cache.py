@@ -0,0 +1,177 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from webdriver_manager.core.utils import ChromeType, get_browser_version_from_os
+
+from selenite.core.web.webdriver_manager import supported
+
+CACHE_PATH = Path(os.getenv('SELENITE_DRIVER_CACHE', Path.home() / '.wdm' / 'selenite-drivers.json'))
+
+offline = os.getenv('SELENITE_DRIVER_OFFLINE', '').lower() in ('1', 'true', 'yes')
+
+_browser_types: Dict[supported.BrowserName, str] = {
+    supported.chrome: ChromeType.GOOGLE,
+    supported.chromium: ChromeType.CHROMIUM,
+    supported.firefox: 'firefox',
+    supported.edge: ChromeType.MSEDGE,
+}
+
+_lock = threading.Lock()
+_locks: Dict[Tuple[str, Path], threading.Lock] = {}
+_resolved: Dict[Tuple[str, Path], str] = {}
+
+
+@lru_cache(maxsize=None)
+def browser_version(name: supported.BrowserName) -> Optional[str]:
+    """
+    Returns the version of the browser installed on this machine, or None if it can not be detected.
+    """
+    browser_type = _browser_types.get(name)
+    if browser_type is None:
+        return None
+    try:
+        return get_browser_version_from_os(browser_type)
+    except Exception:
+        return None
+
+
+@contextmanager
+def _locked(lock: Path) -> Iterator[None]:
+    """
+    Holds an OS lock on a lockfile, shared by the processes of the machine, e.g. xdist workers,
+    and released by the OS if the holding process dies.
+    """
+    lock.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock, 'a+b') as file:
+        if fcntl:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        else:
+            file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _key_lock(name: str, path: Path) -> threading.Lock:
+    with _lock:
+        return _locks.setdefault((name, path), threading.Lock())
+
+
+def _read(path: Path) -> Dict[str, str]:
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _write(path: Path, entries: Dict[str, str]) -> None:
+    temporary = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    temporary.write_text(json.dumps(entries, indent=2))
+    os.replace(temporary, path)
+
+
+def _cached(entries: Dict[str, str], key: str) -> Optional[str]:
+    driver = entries.get(key)
+    return driver if driver and os.path.exists(driver) else None
+
+
+def _latest(entries: Dict[str, str], name: str) -> Optional[str]:
+    drivers = [driver for key, driver in entries.items() if key.split(':')[0] == name and os.path.exists(driver)]
+    return drivers[-1] if drivers else None
+
+
+def driver_path(
+        name: supported.BrowserName,
+        install: Callable[[], str],
+        *,
+        offline: Optional[bool] = None,
+        path: Union[str, Path, None] = None
+) -> str:
+    """
+    Returns the driver binary path for a browser, installing it at most once per machine and browser version.
+
+    Resolved paths are kept in memory for the process and in a JSON cache file keyed by browser and version.
+    The install runs under an OS lock per browser, so parallel workers wait for the first one instead of
+    installing too, while other browsers resolve concurrently. If the browser version can not be detected,
+    the driver is installed without being written to the cache file, so a browser upgrade is never missed.
+    Offline, the driver is never installed, the cached driver of the browser version, or else the latest cached
+    driver of the browser, is returned.
+
+    Args:
+        name: The browser name.
+        install: Installs the driver and returns its path, e.g. ChromeDriverManager().install.
+        offline: Whether to resolve from the cache only, the module offline flag
+            (SELENITE_DRIVER_OFFLINE env var) if None.
+        path: The cache file, CACHE_PATH (SELENITE_DRIVER_CACHE env var) if None.
+
+    Returns:
+        The driver binary path.
+
+    Raises:
+        FileNotFoundError: Offline, if no driver of the browser is cached.
+
+    Example:
+        >>> driver_path('chrome', ChromeDriverManager().install)
+        '/home/user/.wdm/drivers/chromedriver/linux64/120.0.6099.109/chromedriver'
+    """
+    path = Path(path or CACHE_PATH)
+    offline = globals()['offline'] if offline is None else offline
+
+    with _key_lock(name, path):
+        driver = _resolved.get((name, path))
+        if driver:
+            return driver
+
+        version = browser_version(name)
+        key = f'{name}:{version}'
+        driver = _cached(_read(path), key) if version else None
+        if driver is None and offline:
+            driver = _latest(_read(path), name)
+            if driver is None:
+                raise FileNotFoundError(f'No cached {name} driver in {path} to use offline')
+        if driver is None and version is None:
+            driver = install()
+        if driver is None:
+            with _locked(path.with_name(f'{path.name}.{name}.lock')):
+                driver = _cached(_read(path), key)
+                if driver is None:
+                    driver = install()
+                    with _locked(path.with_name(f'{path.name}.lock')):
+                        entries = _read(path)
+                        entries.pop(key, None)
+                        entries[key] = driver
+                        _write(path, entries)
+
+        _resolved[(name, path)] = driver
+        return driver
+
+
+def clear() -> None:
+    """
+    Forgets the driver paths resolved by this process, the cache file is kept.
+    """
+    with _lock:
+        _resolved.clear()
+    browser_version.cache_clear()
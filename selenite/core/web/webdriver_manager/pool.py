@@ -0,0 +1,280 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union
+from urllib.parse import urlsplit
+
+import pytest
+from selene import browser
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from selenite.conf.settings.project.selene import SeleneSettings
+
+CLEAR_STORAGE_SCRIPT = 'window.localStorage.clear(); window.sessionStorage.clear();'
+
+_pytest_scopes = {'method': 'function'}
+
+_CLOSED = object()
+
+
+class DriverPool:
+    """
+    A pool of WebDriver instances launched in the background, handed out one per test
+    and reset between tests: extra tabs closed, cookies and storage cleared, URL set to about:blank.
+
+    A driver is quit and replaced in the background after max_uses leases, or when it crashed
+    or could not be reset. Idle drivers are probed before being handed out, so a driver whose browser
+    crashed while idle is replaced too. After a failed launch, the next launch waits retry_delay,
+    doubling with every further failure up to max_retry_delay.
+
+    Args:
+        factory: Launches a WebDriver, e.g. lambda: set_up.local('chrome', options).
+        size: Number of drivers to keep launched.
+        max_uses: Number of leases after which a driver is recycled.
+        prelaunch: Whether to launch the drivers right away, else on the first acquire.
+        retry_delay: Seconds to wait before relaunching after a failed launch.
+        max_retry_delay: Longest wait before relaunching after failed launches.
+
+    Example:
+        >>> pool = DriverPool(lambda: set_up.local('chrome'), size=2, max_uses=20)
+        >>> with pool.lease() as driver:
+        ...     driver.get('https://example.com')
+        >>> pool.close()
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], WebDriver],
+            size: int = 1,
+            max_uses: int = 50,
+            prelaunch: bool = True,
+            retry_delay: float = 1.0,
+            max_retry_delay: float = 30.0
+    ) -> None:
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._idle: 'queue.Queue[Union[WebDriver, Exception, object]]' = queue.Queue()
+        self._uses: Dict[int, int] = {}
+        self._drivers: List[WebDriver] = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+        self._failures = 0
+        if prelaunch:
+            self.start()
+
+    def start(self) -> None:
+        """
+        Launches the drivers of the pool in background threads.
+        """
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for _ in range(self.size):
+            self._launch_in_background()
+
+    def _launch(self, delay: float = 0.0) -> None:
+        if delay:
+            time.sleep(delay)
+        if self._closed:
+            return
+        try:
+            driver = self.factory()
+        except Exception as error:
+            with self._lock:
+                self._failures += 1
+            self._idle.put(error)
+            return
+        with self._lock:
+            self._failures = 0
+            if self._closed:
+                driver.quit()
+                return
+            self._drivers.append(driver)
+            self._uses[id(driver)] = 0
+        self._idle.put(driver)
+
+    def _launch_in_background(self) -> None:
+        with self._lock:
+            failures = self._failures
+        delay = min(self.retry_delay * 2 ** (failures - 1), self.max_retry_delay) if failures else 0.0
+        threading.Thread(target=self._launch, args=(delay,), name='driver-pool-launch', daemon=True).start()
+
+    @staticmethod
+    def _alive(driver: WebDriver) -> bool:
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver: WebDriver) -> None:
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def acquire(self, timeout: Optional[float] = None) -> WebDriver:
+        """
+        Returns an idle driver, waiting for one to be launched or released.
+
+        Raises:
+            queue.Empty: If no driver is idle within the timeout.
+            RuntimeError: If the pool is closed, or gets closed while waiting.
+            Exception: The error of the factory, if launching a driver failed.
+        """
+        if self._closed:
+            raise RuntimeError('DriverPool is closed')
+        self.start()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            driver = self._idle.get(timeout=None if deadline is None else max(deadline - time.monotonic(), 0))
+            if driver is _CLOSED:
+                self._idle.put(driver)
+                raise RuntimeError('DriverPool is closed')
+            if isinstance(driver, Exception):
+                self._launch_in_background()
+                raise driver
+            if self._alive(driver):
+                break
+            self._discard(driver)
+            self._launch_in_background()
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        if closed:
+            self._discard(driver)
+            raise RuntimeError('DriverPool is closed')
+        return driver
+
+    @staticmethod
+    def _visited_origins(driver: WebDriver) -> Set[str]:
+        history = driver.execute_cdp_cmd('Page.getNavigationHistory', {})
+        urls = (urlsplit(entry['url']) for entry in history['entries'])
+        return {f'{url.scheme}://{url.netloc}' for url in urls if url.scheme in ('http', 'https')}
+
+    def reset(self, driver: WebDriver) -> None:
+        """
+        Closes every tab but the first, clears cookies, local and session storage, and opens about:blank.
+
+        On Chromium drivers, cookies are cleared browser-wide over CDP, and the storage of every origin
+        in the navigation history of the open tabs too. Other drivers only clear the cookies and storage
+        of the origin loaded in the first tab, the cookies and storage of other origins the test visited,
+        as well as the storage of origins visited in tabs closed by the test, leak into the next lease:
+        use max_uses=1 where that matters.
+        """
+        cdp = hasattr(driver, 'execute_cdp_cmd')
+        origins: Set[str] = set()
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            if cdp:
+                origins |= self._visited_origins(driver)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.delete_all_cookies()
+        if cdp:
+            origins |= self._visited_origins(driver)
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            for origin in origins:
+                driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+        try:
+            driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        except Exception:
+            pass
+        driver.get('about:blank')
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Returns a driver to the pool, reset, or recycles it after max_uses leases or if it can not be reset.
+        """
+        with self._lock:
+            worn_out = self._closed or self._uses.get(id(driver), 0) >= self.max_uses
+        if not worn_out:
+            try:
+                self.reset(driver)
+                self._idle.put(driver)
+                return
+            except Exception:
+                pass
+        self._discard(driver)
+        if not self._closed:
+            self._launch_in_background()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[WebDriver]:
+        """
+        Acquires a driver for the block and releases it after.
+        """
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        """
+        Quits every driver of the pool, drivers still launching are quit once launched,
+        and fails the acquire calls waiting for a driver.
+        """
+        with self._lock:
+            self._closed = True
+            drivers, self._drivers = self._drivers, []
+            self._uses.clear()
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        self._idle.put(_CLOSED)
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def pytest_scope(settings: SeleneSettings) -> str:
+    """
+    Returns the pytest fixture scope for SeleneSettings.browser_management_scope, function if unset.
+
+    Example:
+        >>> pytest_scope(SeleneSettings.construct(browser_management_scope='method'))
+        'function'
+    """
+    scope = settings.browser_management_scope or 'function'
+    return _pytest_scopes.get(scope, scope)
+
+
+def pooled_browser(pool: DriverPool, settings: SeleneSettings) -> Any:
+    """
+    Creates a fixture setting browser.config.driver to a pooled driver, leased for
+    SeleneSettings.browser_management_scope.
+
+    Args:
+        pool: The pool to lease drivers from.
+        settings: The settings with browser_management_scope.
+
+    Returns:
+        A pytest fixture yielding the leased driver.
+
+    Example:
+        >>> # conftest.py
+        >>> settings = SeleneSettings.in_context('.env')
+        >>> pool = DriverPool(lambda: set_up.local(settings.browser_name), size=2)
+        >>> browser_driver = pooled_browser(pool, settings)
+    """
+    @pytest.fixture(scope=pytest_scope(settings))
+    def fixture() -> Iterator[WebDriver]:
+        with pool.lease() as driver:
+            browser.config.driver = driver
+            yield driver
+
+    return fixture
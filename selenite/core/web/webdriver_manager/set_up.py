@@ -13,6 +13,7 @@ from webdriver_manager.microsoft import EdgeChromiumDriverManager, IEDriverManag
 
 from selenite.core.web.selenium.typing import WebDriverOptions
 from selenite.core.web.webdriver_manager import supported
+from selenite.core.web.webdriver_manager.driver_cache import driver_path
 
 installers: Dict[
     supported.BrowserName,
@@ -20,27 +21,29 @@ installers: Dict[
 ] = {
     supported.chrome:
         lambda opts: webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
+            service=ChromeService(driver_path(supported.chrome, lambda: ChromeDriverManager().install())),
             options=opts,
         ),
     supported.chromium:
         lambda opts: webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install()),
+            service=ChromeService(driver_path(
+                supported.chromium, lambda: ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install()
+            )),
             options=opts,
         ),
     supported.firefox:
         lambda opts: webdriver.Firefox(
-            service=FirefoxService(GeckoDriverManager().install()),
+            service=FirefoxService(driver_path(supported.firefox, lambda: GeckoDriverManager().install())),
             options=opts,
         ),
     supported.ie:
         lambda opts: webdriver.Ie(
-            service=IEService(IEDriverManager().install()),
+            service=IEService(driver_path(supported.ie, lambda: IEDriverManager().install())),
             options=opts,
         ),
     supported.edge:
         lambda ____: webdriver.Edge(
-            service=EdgeService(EdgeChromiumDriverManager().install()),
+            service=EdgeService(driver_path(supported.edge, lambda: EdgeChromiumDriverManager().install())),
         )
 }
 
@@ -50,6 +53,6 @@ def local(
         options: WebDriverOptions = None
 ) -> WebDriver:
     """
-    Returns a local WebDriver instance.
+    Returns a local WebDriver instance, its driver binary resolved once per machine by driver_cache.
     """
     return installers[name](options)
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from selenite.core.api.requests.async_http_decorator import AsyncHttpDecorator, close_shared_client
+
+
+def test_async_decorated_method_reads_base_url_and_header(base_url):
+    class Api:
+        header = {'Token': 'secret'}
+
+        def __init__(self):
+            self.base_url = base_url
+
+        @AsyncHttpDecorator(url='/users', method='post')
+        def create_user(self, name):
+            return {'json': {'name': name}, 'params': {'dry': 1}}
+
+    async def main():
+        try:
+            return await Api().create_user('John')
+        finally:
+            await close_shared_client()
+
+    res = asyncio.run(main())
+
+    assert res.json() == {'method': 'POST', 'path': '/users?dry=1', 'token': 'secret', 'body': {'name': 'John'}}
+
+
+def test_async_decorated_calls_run_concurrently_with_gather(base_url):
+    @AsyncHttpDecorator(url=f'{base_url}/items')
+    async def get_item(index):
+        return {'url': f'{base_url}/items/{index}'}
+
+    async def main():
+        try:
+            return await asyncio.gather(*(get_item(i) for i in range(50)))
+        finally:
+            await close_shared_client()
+
+    responses = asyncio.run(main())
+
+    assert [res.json()['path'] for res in responses] == [f'/items/{i}' for i in range(50)]
+
+
+def test_async_decorator_rejects_sync_only_options_and_stores_no_cookies(base_url, received):
+    with pytest.raises(TypeError):
+        AsyncHttpDecorator(url='/users', retry=object())
+
+    @AsyncHttpDecorator(url=f'{base_url}/login')
+    def login():
+        pass
+
+    @AsyncHttpDecorator(url=f'{base_url}/users/me')
+    def me():
+        pass
+
+    async def main():
+        try:
+            await login()
+            return await me()
+        finally:
+            await close_shared_client()
+
+    asyncio.run(main())
+
+    assert 'Cookie' not in received[-1][2]
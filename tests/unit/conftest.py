@@ -0,0 +1,76 @@
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    received = []
+    failures = 0
+
+    def _echo(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode() if length else ''
+        self.received.append((self.command, self.path, dict(self.headers)))
+
+        if self.path.startswith('/login'):
+            self.send_response(302)
+            self.send_header('Set-Cookie', 'sid=1; Path=/')
+            self.send_header('Location', '/users/me')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        if self.path.startswith('/flaky') and EchoHandler.failures > 0:
+            EchoHandler.failures -= 1
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        if self.path.startswith('/etag') and self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.send_header('ETag', '"v1"')
+            self.end_headers()
+            return
+
+        payload = json.dumps({
+            'method': self.command,
+            'path': self.path,
+            'token': self.headers.get('Token'),
+            'body': json.loads(body) if body and 'json' in self.headers.get('Content-Type', '') else body or None,
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        if self.path.startswith('/etag'):
+            self.send_header('ETag', '"v1"')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = _echo
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), EchoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+
+
+@pytest.fixture
+def received():
+    EchoHandler.received.clear()
+    EchoHandler.failures = 0
+    return EchoHandler.received
+
+
+@pytest.fixture
+def echo(received):
+    return EchoHandler
@@ -0,0 +1,97 @@
+import json
+import threading
+
+import pytest
+
+from selenite.core.web.webdriver_manager import driver_cache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(driver_cache, 'get_browser_version_from_os', lambda browser_type: '120.0')
+    driver_cache.clear()
+    yield tmp_path / 'drivers.json'
+    driver_cache.clear()
+
+
+def test_driver_is_installed_once_for_concurrent_workers(cache, tmp_path):
+    binary = tmp_path / 'chromedriver'
+    binary.touch()
+    installs = []
+
+    def install():
+        installs.append(1)
+        return str(binary)
+
+    results = []
+
+    def worker():
+        try:
+            results.append(driver_cache.driver_path('chrome', install, path=cache))
+        except Exception as error:
+            results.append(error)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [str(binary)] * 8
+    driver_cache.clear()
+    assert driver_cache.driver_path('chrome', install, path=cache) == str(binary)
+    assert len(installs) == 1
+
+
+def test_browsers_resolve_concurrently(cache, tmp_path):
+    chrome_installing, firefox_resolved = threading.Event(), threading.Event()
+    results = {}
+
+    def install_chrome():
+        chrome_installing.set()
+        assert firefox_resolved.wait(5), 'firefox waited for the chrome install'
+        return str(tmp_path / 'chromedriver')
+
+    def worker():
+        try:
+            results['chrome'] = driver_cache.driver_path('chrome', install_chrome, path=cache)
+        except Exception as error:
+            results['chrome'] = error
+
+    (tmp_path / 'chromedriver').touch()
+    (tmp_path / 'geckodriver').touch()
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert chrome_installing.wait(5)
+    results['firefox'] = driver_cache.driver_path('firefox', lambda: str(tmp_path / 'geckodriver'), path=cache)
+    firefox_resolved.set()
+    thread.join()
+
+    assert results == {'chrome': str(tmp_path / 'chromedriver'), 'firefox': str(tmp_path / 'geckodriver')}
+    assert set(json.loads(cache.read_text())) == {'chrome:120.0', 'firefox:120.0'}
+
+
+def test_driver_of_unknown_browser_version_is_not_cached(cache, tmp_path, monkeypatch):
+    binary = tmp_path / 'chromedriver'
+    binary.touch()
+    monkeypatch.setattr(driver_cache, 'get_browser_version_from_os', lambda browser_type: None)
+    driver_cache.clear()
+
+    assert driver_cache.driver_path('chrome', lambda: str(binary), path=cache) == str(binary)
+    assert not cache.exists()
+
+
+def test_offline_resolves_from_cache_only(cache, tmp_path, monkeypatch):
+    binary = tmp_path / 'geckodriver'
+    binary.touch()
+
+    def install():
+        raise AssertionError('should not install offline')
+
+    with pytest.raises(FileNotFoundError, match='firefox'):
+        driver_cache.driver_path('firefox', install, offline=True, path=cache)
+
+    driver_cache.driver_path('firefox', lambda: str(binary), path=cache)
+    monkeypatch.setattr(driver_cache, 'get_browser_version_from_os', lambda browser_type: '121.0')
+    driver_cache.clear()
+    assert driver_cache.driver_path('firefox', install, offline=True, path=cache) == str(binary)
@@ -0,0 +1,436 @@
+import json
+import time
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+import requests
+from requests import RequestException
+
+from selenite.core.api.requests import timing
+from selenite.core.api.requests.cache import ResponseCache
+from selenite.core.api.requests.cassette import CassetteMiss, use_cassette
+from selenite.core.api.requests.fan_out import fan_out, TokenBucket
+from selenite.core.api.requests.http_decorator import HttpDecorator
+from selenite.core.api.requests.json_stream import iter_path, parse_path
+from selenite.core.api.requests.load import LatencyHistogram, run_load
+from selenite.core.api.requests.response import build_response, save_to, pipe_to
+from selenite.core.api.requests.retry import RetryPolicy, CircuitBreaker
+from selenite.conf.pytest.stand_in import stand_in_server
+from selenite.core.api.requests.stand_in import StandInServer
+
+
+def api_class(base_url):
+    class Api:
+        header = {'Token': 'secret'}
+
+        def __init__(self):
+            self.base_url = base_url
+
+        @HttpDecorator(url='/users', method='post')
+        def create_user(self, name):
+            return {'json': {'name': name}}
+
+        @HttpDecorator(url='/users')
+        def get_user(self, index):
+            return {'url': f'/users/{index}'}
+
+    return Api
+
+
+def test_decorated_method_reads_base_url_and_header(base_url):
+    res = api_class(base_url)().create_user('John')
+
+    assert res.json() == {'method': 'POST', 'path': '/users', 'token': 'secret', 'body': {'name': 'John'}}
+
+
+def test_fan_out_returns_responses_in_order(base_url):
+    api = api_class(base_url)()
+
+    results = fan_out(api.get_user, [(i,) for i in range(40)], max_workers=8)
+
+    assert [r.response.json()['path'] for r in results] == [f'/users/{i}' for i in range(40)]
+    assert all(r.error is None and r.latency > 0 for r in results)
+
+
+def test_cookies_follow_redirects_within_a_call_only(base_url, received):
+    @HttpDecorator(url=f'{base_url}/login')
+    def login():
+        pass
+
+    @HttpDecorator(url=f'{base_url}/users/me')
+    def me():
+        pass
+
+    login()
+    assert [(path, headers.get('Cookie')) for _, path, headers in received] == [('/login', None), ('/users/me', 'sid=1')]
+
+    me()
+    assert 'Cookie' not in received[-1][2]
+
+
+def test_fan_out_collects_errors_per_call():
+    def flaky(index):
+        if index == 1:
+            raise ValueError('boom')
+        return index
+
+    results = fan_out(flaky, [(0,), (1,), (2,)])
+
+    assert [r.response for r in results] == [0, None, 2]
+    assert isinstance(results[1].error, ValueError)
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50, burst=1)
+
+    start = time.monotonic()
+    for _ in range(11):
+        bucket.acquire()
+
+    assert time.monotonic() - start >= 0.19
+
+
+def test_cache_serves_fresh_entry_without_request(base_url, received, tmp_path):
+    cache = ResponseCache(ttl=60, store=str(tmp_path / 'cache.sqlite'))
+
+    @HttpDecorator(url=f'{base_url}/countries', cache=cache)
+    def countries():
+        pass
+
+    first, second = countries(), countries()
+    cache.clear()
+    from_disk = countries()
+
+    assert len(received) == 1
+    assert second.from_cache and from_disk.from_cache
+    assert first.json() == second.json() == from_disk.json()
+
+
+def test_cache_revalidates_stale_entry_with_etag(base_url, received):
+    cache = ResponseCache(ttl=0)
+
+    @HttpDecorator(url=f'{base_url}/etag/profile', cache=cache)
+    def profile():
+        pass
+
+    first, second = profile(), profile()
+
+    assert [headers.get('If-None-Match') for _, _, headers in received] == [None, '"v1"']
+    assert second.status_code == 200 and second.from_cache
+    assert second.json() == first.json()
+
+
+def test_cache_honours_no_cache_and_max_age(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr('selenite.core.api.requests.cache.time.time', lambda: clock[0])
+    cache = ResponseCache(ttl=60)
+    sent = []
+
+    def send(cache_control):
+        def send_(request):
+            sent.append(request.url)
+            headers = {'Cache-Control': cache_control, 'ETag': '"v1"'}
+            status_code = 304 if request.headers.get('If-None-Match') else 200
+            return build_response(request, status_code=status_code, headers=headers, content=b'{}', url=request.url)
+        return send_
+
+    def fetch(url, cache_control):
+        return cache.fetch(requests.Request('GET', url).prepare(), send(cache_control))
+
+    fetch('http://api/no-cache', 'no-cache')
+    assert fetch('http://api/no-cache', 'no-cache').from_cache and len(sent) == 2
+
+    fetch('http://api/max-age', 'private, max-age=10')
+    clock[0] += 5
+    assert fetch('http://api/max-age', 'max-age=10').from_cache and len(sent) == 3
+    clock[0] += 10
+    fetch('http://api/max-age', 'max-age=10')
+    assert len(sent) == 4
+
+
+def test_encoding_comes_from_headers_and_is_sniffed_lazily(base_url):
+    res = api_class(base_url)().get_user(1)
+
+    assert res.encoding is None
+    assert res.json()['path'] == '/users/1'
+
+
+def test_stream_mode_reads_body_in_chunks(base_url, tmp_path):
+    @HttpDecorator(url=f'{base_url}/export', stream=True)
+    def export():
+        pass
+
+    chunks = []
+    size = pipe_to(export(), chunks.append, chunk_size=8)
+    saved = save_to(export(), tmp_path / 'export.json')
+
+    assert len(chunks) > 1 and all(len(chunk) <= 8 for chunk in chunks)
+    assert size == saved == (tmp_path / 'export.json').stat().st_size
+    assert json.loads((tmp_path / 'export.json').read_text())['path'] == '/export'
+
+
+def test_cassette_replays_recorded_interactions_without_network(base_url, received, tmp_path):
+    path = tmp_path / 'api.jsonl.gz'
+    api = api_class(base_url)()
+
+    with use_cassette(path, mode='record'):
+        recorded = [api.create_user('John').json(), api.get_user(1).json()]
+    with use_cassette(path, mode='replay'):
+        replayed = [api.create_user('John').json(), api.get_user(1).json()]
+        with pytest.raises(CassetteMiss):
+            api.get_user(2)
+
+    assert replayed == recorded
+    assert len(received) == 2
+
+
+def test_cassette_fingerprints_uploads_and_records_streams_as_read(base_url, received, tmp_path):
+    path = tmp_path / 'api.jsonl.gz'
+
+    @HttpDecorator(url=f'{base_url}/imports', method='post')
+    def upload(content):
+        return {'files': {'file': ('report.csv', content)}}
+
+    @HttpDecorator(url=f'{base_url}/export', stream=True)
+    def export():
+        pass
+
+    with use_cassette(path, mode='record'):
+        recorded = [upload(b'a,b').json()['body'], upload(b'c,d').json()['body']]
+        res = export()
+        assert not res._content_consumed
+        streamed = b''.join(res.iter_content(8))
+    with use_cassette(path, mode='replay'):
+        assert [upload(b'a,b').json()['body'], upload(b'c,d').json()['body']] == recorded
+        assert b''.join(export().iter_content(8)) == streamed
+        with pytest.raises(CassetteMiss):
+            upload(b'e,f')
+
+    assert 'a,b' in recorded[0] and 'c,d' in recorded[1]
+    assert len(received) == 3
+
+
+def test_latency_histogram_percentiles_keep_three_significant_digits():
+    histogram = LatencyHistogram()
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=1e-3)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=1e-3)
+
+
+def test_run_load_records_weighted_mix(base_url):
+    api = api_class(base_url)()
+
+    result = run_load({partial(api.get_user, 1): 3, partial(api.create_user, 'John'): 1}, duration=0.5, rps=100, concurrency=4)
+    summary = result.to_dict()
+
+    assert set(summary['endpoints']) == {'get_user', 'create_user'}
+    assert 20 <= summary['overall']['count'] <= 60
+    assert summary['overall']['errors'] == 0
+    assert summary['overall']['p99'] >= summary['overall']['p50'] > 0
+
+
+def test_run_load_keeps_to_rps_and_duration():
+    starts = []
+
+    def call():
+        starts.append(time.monotonic())
+
+    started = time.monotonic()
+    result = run_load(call, duration=1, rps=4, concurrency=8)
+
+    assert time.monotonic() - started < 1.3
+    assert 4 <= result.to_dict()['overall']['count'] <= 5
+    assert sum(start - started < 0.1 for start in starts) == 1
+
+
+def test_timing_breakdown_tells_new_from_reused_connections(base_url):
+    timing.reset()
+
+    @HttpDecorator(url=f'{base_url}/timed', timing=True)
+    def timed():
+        pass
+
+    fan_out(timed, [()] * 3, max_workers=1)
+    endpoint = f'GET {timed.__qualname__}'
+    summary = timing.summary()[endpoint]
+
+    assert summary['count'] == 3
+    assert summary['new_connections'] == pytest.approx(1 / 3)
+    assert summary['total']['mean'] >= summary['ttfb']['mean'] > 0
+
+
+def test_retry_policy_retries_idempotent_calls_only(base_url, echo):
+    policy = RetryPolicy(attempts=3, backoff=0.01)
+
+    @HttpDecorator(url=f'{base_url}/flaky', retry=policy)
+    def get_flaky():
+        pass
+
+    @HttpDecorator(url=f'{base_url}/flaky', method='post', retry=policy)
+    def post_flaky():
+        pass
+
+    echo.failures = 2
+    assert get_flaky().status_code == 200
+    echo.failures = 1
+    assert post_flaky().status_code == 503
+    assert len(echo.received) == 4
+
+
+def test_circuit_breaker_fails_fast_once_host_is_down(base_url, echo):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    @HttpDecorator(url=f'{base_url}/flaky', breaker=breaker)
+    def get_flaky():
+        pass
+
+    echo.failures = 10
+    assert [get_flaky().status_code for _ in range(2)] == [503, 503]
+    with pytest.raises(RequestException, match='Circuit'):
+        get_flaky()
+    assert len(echo.received) == 2
+
+
+def test_response_model_is_validated_once_and_json_memoized(base_url):
+    class Echo(BaseModel):
+        method: str
+        path: str
+        token: Optional[str]
+
+    @HttpDecorator(url=f'{base_url}/typed', model=Echo, memoize_json=True)
+    def typed():
+        pass
+
+    res = typed()
+
+    assert res.model == Echo(method='GET', path='/typed', token=None)
+    assert res.json() is res.json()
+
+
+def test_response_model_is_not_parsed_for_error_responses(base_url, echo):
+    class Echo(BaseModel):
+        method: str
+
+    @HttpDecorator(url=f'{base_url}/flaky', model=Echo)
+    def flaky():
+        pass
+
+    echo.failures = 1
+    res = flaky()
+
+    assert res.status_code == 503 and res.model is None
+    assert flaky().json() is not flaky().json()
+
+
+def test_files_are_streamed_from_disk_and_rewound_on_retry(base_url, echo, tmp_path):
+    report = tmp_path / 'report.csv'
+    report.write_bytes(b'id,name\n' * 10_000)
+    progress = []
+
+    @HttpDecorator(
+        url=f'{base_url}/flaky',
+        method='post',
+        retry=RetryPolicy(backoff=0.01, retry_non_idempotent=True),
+        upload_progress=lambda sent, total: progress.append((sent, total)),
+    )
+    def upload():
+        return {'files': {'report': Path(report)}, 'data': {'kind': 'users'}}
+
+    echo.failures = 1
+    res = upload()
+
+    _, _, headers = echo.received[-1]
+    body = res.json()['body']
+    assert res.status_code == 200
+    assert headers['Content-Type'].startswith('multipart/form-data; boundary=')
+    assert int(headers['Content-Length']) == progress[-1][1] == len(body)
+    assert 'filename="report.csv"' in body and 'Content-Type: text/csv' in body
+    assert body.count('id,name') == 10_000
+    assert len(echo.received) == 2
+
+
+def test_iter_path_parses_chunks_incrementally_and_stops_early(base_url):
+    document = {
+        'meta': {'note': 'braces } and "quotes" \\ [inside]', 'total': 3},
+        'users': [{'id': i, 'tags': ['a', {'deep': [i]}], 'name': f'user {i}'} for i in range(3)],
+    }
+    body = json.dumps(document).encode()
+    read = []
+
+    class Body:
+        encoding = None
+
+        def iter_content(self, chunk_size):
+            for start in range(0, len(body), chunk_size):
+                read.append(chunk_size)
+                yield body[start:start + chunk_size]
+
+        def close(self):
+            pass
+
+    assert parse_path("$.users[*]['name']") == ('users', '*', 'name')
+    assert list(iter_path(Body(), '$.users[*].id', chunk_size=7)) == [0, 1, 2]
+    assert list(iter_path(Body(), '$.users[*].tags[1].deep', chunk_size=5)) == [[0], [1], [2]]
+    assert list(iter_path(Body(), '$.meta.*', chunk_size=3)) == [document['meta']['note'], 3]
+
+    read.clear()
+    assert next(iter_path(Body(), '$.meta.total', chunk_size=8)) == 3
+    assert sum(read) < len(body) / 2
+
+    @HttpDecorator(url=f'{base_url}/big', stream=True)
+    def big():
+        pass
+
+    assert list(big().iter_path('$.path')) == ['/big']
+
+
+def test_stand_in_server_serves_routes_for_any_base_url(stand_in_server):
+    class UserApi:
+        base_url = 'https://backend.invalid'
+
+        @HttpDecorator(url='/users/{}')
+        def get_user(self, user_id):
+            return {'url': f'/users/{user_id}'}
+
+        @HttpDecorator(url='/users', method='post')
+        def create_user(self, name):
+            return {'json': {'name': name}}
+
+    @stand_in_server.route('GET', '/users/{user_id}')
+    def get_user(request, user_id):
+        return {'id': int(user_id)}
+
+    stand_in_server.route('POST', '/users', (201, None))
+
+    assert UserApi().get_user(7).json() == {'id': 7}
+    assert UserApi().create_user('John').status_code == 201
+    assert stand_in_server.received[-1].json() == {'name': 'John'}
+    assert UserApi().get_user('x/y').status_code == 404
+
+
+def test_stand_in_server_injects_errors_and_replays_cassettes(base_url, tmp_path):
+    @HttpDecorator(url=f'{base_url}/recorded', retry=RetryPolicy(attempts=5, backoff=0.001))
+    def recorded():
+        pass
+
+    with use_cassette(tmp_path / 'api.jsonl.gz', mode='record'):
+        expected = recorded().json()
+
+    with StandInServer(cassette=tmp_path / 'api.jsonl.gz', error_rate=0.5, seed=1) as server:
+        assert [recorded().json() for _ in range(4)] == [expected] * 4
+        failed = len(server.received) - 4
+
+    with StandInServer(latency=0.05, error_rate=1, error_status=None) as server:
+        started = time.perf_counter()
+        with pytest.raises(RequestException):
+            recorded()
+        assert time.perf_counter() - started >= 5 * 0.05
+        assert len(server.received) == 5
+
+    assert failed > 0
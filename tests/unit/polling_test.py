@@ -0,0 +1,130 @@
+import itertools
+
+import pytest
+from selene import Config
+from selene.core.exceptions import TimeoutException
+
+from selenite.conf.settings.project.selene import SeleneSettings
+from selenite.core.web.selene import browser_config, polling
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+        self.pauses = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.pauses.append(round(seconds, 3))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(polling, 'time', clock)
+    return clock
+
+
+class Ready:
+    def __init__(self, clock, after):
+        self.clock = clock
+        self.at = clock.time() + after
+
+    def __call__(self, entity):
+        if self.clock.time() < self.at:
+            raise AssertionError('not yet')
+
+    def __str__(self):
+        return 'be.ready'
+
+
+def test_intervals_follow_the_polling_strategy():
+    def first(strategy, n=6):
+        settings = SeleneSettings.construct(polling_strategy=strategy, polling_fast_start=2)
+        return [round(_, 3) for _ in itertools.islice(polling.intervals(settings), n)]
+
+    assert first('fixed') == [0.1] * 6
+    assert first('backoff') == [0.1, 0.2, 0.4, 0.8, 1.0, 1.0]
+    assert first('fast_start') == [0.01, 0.01, 0.1, 0.2, 0.4, 0.8]
+    assert first('mutation', 2) == [1.0, 1.0]
+
+
+def test_polling_wait_backs_off_and_counts_polls(clock):
+    polling.reset()
+    settings = SeleneSettings.construct(polling_strategy='backoff', polling_interval=0.05, polling_max_interval=0.2)
+    wait = polling.PollingWait('page', at_most=2, settings=settings)
+
+    wait.for_(Ready(clock, after=0.5))
+    assert clock.pauses == [0.05, 0.1, 0.2, 0.2]
+    assert polling.counts() == {'waits': 1, 'polls': 5}
+
+    with pytest.raises(TimeoutException, match='page.be.ready'):
+        wait.at_most(0.1).for_(Ready(clock, after=10))
+    assert polling.counts()['waits'] == 2
+
+
+def test_polling_wait_keeps_its_decorator_when_overridden(clock):
+    decorated = []
+
+    def decorator(wait):
+        def decorate(fn):
+            def wrapped(*args):
+                decorated.append(wait._timeout)
+                return fn(*args)
+            return wrapped
+        return decorate
+
+    wait = polling.PollingWait('page', at_most=2, _decorator=decorator)
+    wait.at_most(1).for_(Ready(clock, after=0))
+    wait.or_fail_with(None).for_(Ready(clock, after=0))
+
+    assert decorated == [1, 2]
+
+
+def test_browser_config_settings_build_polling_waits():
+    settings = SeleneSettings.construct(timeout=3.0, polling_strategy='backoff', save_screenshot_on_failure=False)
+    config = browser_config.browser_config_settings(settings, Config())
+    wait = config.wait('page')
+
+    assert isinstance(wait, polling.PollingWait)
+    assert wait.settings.polling_strategy == 'backoff'
+    assert wait._timeout == 3.0
+    assert config.save_screenshot_on_failure is False
+
+
+def test_mutation_pause_ends_at_once_on_mutations_made_after_a_failed_poll(clock):
+    class Page:
+        def __init__(self):
+            self.count = None
+            self.scripts = []
+
+        def execute_async_script(self, script, seen, timeout_ms):
+            self.scripts.append(seen)
+            if self.count is not None and self.count != seen:
+                return self.count
+            self.count = self.count or 0
+            clock.sleep(timeout_ms / 1000)
+            return self.count
+
+    class Rendered:
+        def __init__(self, polls):
+            self.polls = polls
+
+        def __call__(self, entity):
+            self.polls -= 1
+            if self.polls:
+                page.count += 1
+                raise AssertionError('not rendered yet')
+
+    page = Page()
+    settings = SeleneSettings.construct(polling_strategy='mutation', polling_max_interval=1.0)
+    wait = polling.PollingWait('page', at_most=5, settings=settings, driver=lambda: page)
+
+    wait.for_(Ready(clock, after=0.5))
+    assert clock.pauses == [1.0] and page.scripts == [None]
+
+    wait.for_(Rendered(polls=3))
+    assert clock.pauses == [1.0] and page.scripts == [None, 0, 1]
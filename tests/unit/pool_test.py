@@ -0,0 +1,154 @@
+import threading
+import time
+
+import pytest
+
+from selenite.conf.settings.project.selene import SeleneSettings
+from selenite.core.web.webdriver_manager import pool as pool_module
+from selenite.core.web.webdriver_manager.pool import DriverPool, pytest_scope
+
+
+class FakeDriver:
+    def __init__(self):
+        self.window_handles = ['main']
+        self.cookies = ['session']
+        self.url = 'https://example.com'
+        self.quit_called = False
+        self.crashed = False
+        self.switch_to = self
+
+    @property
+    def current_url(self):
+        if self.crashed:
+            raise ConnectionError('browser is gone')
+        return self.url
+
+    def window(self, handle):
+        self.current = handle
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def execute_script(self, script):
+        pass
+
+    def get(self, url):
+        if self.crashed:
+            raise ConnectionError('browser is gone')
+        self.url = url
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_pool_resets_between_leases_and_recycles_drivers():
+    launched = []
+    lock = threading.Lock()
+
+    def factory():
+        with lock:
+            launched.append(FakeDriver())
+            return launched[-1]
+
+    pool = DriverPool(factory, size=1, max_uses=2)
+
+    with pool.lease(timeout=5) as first:
+        first.window_handles.append('popup')
+    assert first.window_handles == ['main'] and first.cookies == [] and first.url == 'about:blank'
+
+    with pool.lease(timeout=5) as driver:
+        assert driver is first
+    assert first.quit_called
+
+    with pool.lease(timeout=5) as second:
+        assert second is not first
+        second.crashed = True
+    with pool.lease(timeout=5) as third:
+        assert third is not second and second.quit_called
+
+    pool.close()
+    assert third.quit_called and len(launched) == 3
+
+
+class FakeChromiumDriver(FakeDriver):
+    def __init__(self):
+        super().__init__()
+        self.history = {'main': ['https://shop.example.com/cart'], 'popup': ['https://pay.example.com/checkout']}
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, args):
+        self.commands.append((cmd, args))
+        if cmd == 'Page.getNavigationHistory':
+            return {'entries': [{'url': url} for url in ['about:blank', *self.history[self.current]]]}
+        return {}
+
+
+def test_pool_clears_cookies_and_storage_of_every_visited_origin_on_chromium():
+    pool = DriverPool(FakeChromiumDriver, size=1)
+
+    with pool.lease(timeout=5) as driver:
+        driver.window_handles.append('popup')
+
+    cleared = {args['origin'] for cmd, args in driver.commands if cmd == 'Storage.clearDataForOrigin'}
+    assert cleared == {'https://shop.example.com', 'https://pay.example.com'}
+    assert ('Network.clearBrowserCookies', {}) in driver.commands
+    pool.close()
+
+
+def test_pool_replaces_drivers_crashed_while_idle():
+    launched = []
+    pool = DriverPool(lambda: launched.append(FakeDriver()) or launched[-1], size=1)
+
+    with pool.lease(timeout=5) as first:
+        pass
+    first.crashed = True
+
+    with pool.lease(timeout=5) as second:
+        assert second is not first and first.quit_called
+    pool.close()
+
+
+def test_acquire_fails_once_the_pool_is_closed():
+    pool = DriverPool(FakeDriver, size=1)
+    with pool.lease(timeout=5):
+        waiting = []
+        thread = threading.Thread(target=lambda: waiting.append(pytest.raises(RuntimeError, pool.acquire)))
+        thread.start()
+        pool.close()
+        thread.join(5)
+    assert waiting and not thread.is_alive()
+
+    with pytest.raises(RuntimeError, match='closed'):
+        pool.acquire()
+
+
+def test_failed_launches_are_retried_with_backoff(monkeypatch):
+    delays = []
+
+    class Time:
+        monotonic = staticmethod(time.monotonic)
+
+        @staticmethod
+        def sleep(seconds):
+            delays.append(seconds)
+
+    def factory():
+        raise ConnectionError('no browser')
+
+    monkeypatch.setattr(pool_module, 'time', Time)
+    pool = DriverPool(factory, size=1, retry_delay=1, max_retry_delay=4)
+    for _ in range(5):
+        with pytest.raises(ConnectionError):
+            pool.acquire(timeout=5)
+    pool.close()
+
+    assert delays[:4] == [1, 2, 4, 4]
+
+
+def test_pytest_scope_follows_browser_management_scope():
+    assert pytest_scope(SeleneSettings.construct(browser_management_scope='session')) == 'session'
+    assert pytest_scope(SeleneSettings.construct(browser_management_scope='method')) == 'function'
+    assert pytest_scope(SeleneSettings.construct()) == 'function'
@@ -0,0 +1,358 @@
+import asyncio
+import contextlib
+import contextvars
+import json
+
+import allure
+import allure_commons
+import pytest
+from allure_commons import plugin_manager
+from allure_commons.model2 import TestResult, TestStepResult
+from allure_commons.reporter import AllureReporter
+from allure_commons.utils import now
+
+from selenite.conf.allure import gherkin, profiler, report, step_buffer
+from selenite.conf.python.etc import translator
+from selenite.core.web.selene.report import log_with
+
+
+class StepRecorder:
+    def __init__(self):
+        self.titles = []
+        self.params = []
+        self.events = []
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self.titles.append(title)
+        self.params.append(dict(params))
+        self.events.append(title)
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid):
+        self.events.append('/')
+
+    @allure_commons.hookimpl
+    def attach_data(self, name):
+        self.events.append(f'@{name}')
+
+
+class AllureListener:
+    def __init__(self):
+        self.allure_logger = AllureReporter()
+        self.test = TestResult(name='test')
+        self.allure_logger.schedule_test('test', self.test)
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self.allure_logger.start_step(None, uuid, TestStepResult(name=title, start=now()))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid):
+        self.allure_logger.stop_step(uuid, stop=now())
+
+
+@pytest.fixture
+def steps():
+    recorder = StepRecorder()
+    plugin_manager.register(recorder)
+    yield recorder
+    plugin_manager.unregister(recorder)
+
+
+@report.step
+def open_page(url, timeout=4, *tags, retries, verbose=False):
+    pass
+
+
+@report.step('Fill the field')
+def fill(value):
+    pass
+
+
+class LoginPage:
+
+    @report.step
+    def sign_in(self, user, password='secret'):
+        pass
+
+    @report.step(display_context=False, derepresent_params=True)
+    def type_(self, text):
+        pass
+
+    def __str__(self):
+        return 'login page'
+
+
+def test_step_titles(steps):
+    open_page('/home', retries=2)
+    open_page('/home', 1, 'smoke', 'fast', retries=0, verbose=True)
+    fill('John')
+    fill(value='John')
+    LoginPage().sign_in('admin')
+    LoginPage().sign_in(user='admin', password='1')
+    LoginPage().type_('hello')
+
+    assert steps.titles == [
+        "open page: '/home', timeout 4, retries 2, verbose False [report_test]",
+        "open page: '/home', 1, tags ('smoke', 'fast'), retries 0, verbose True [report_test]",
+        "Fill the field 'John' [report_test]",
+        "Fill the field value 'John' [report_test]",
+        "sign in: 'admin', password 'secret' [login page]",
+        "sign in: user 'admin', password '1' [login page]",
+        "type 'hello'",
+    ]
+    assert steps.params[0] == {'url': "'/home'", 'timeout': '4', 'retries': '2', 'verbose': 'False'}
+
+
+def test_step_params_are_rendered_only_while_reporting_and_capped():
+    class Table:
+        rendered = 0
+
+        def __repr__(self):
+            Table.rendered += 1
+            return 'table'
+
+    @report.step
+    def check(table, rows=None):
+        return 'checked'
+
+    assert check(Table()) == 'checked'
+    assert Table.rendered == 0
+
+    recorder = StepRecorder()
+    plugin_manager.register(recorder)
+    try:
+        check(Table(), rows=list(range(10_000)))
+    finally:
+        plugin_manager.unregister(recorder)
+
+    assert Table.rendered == 1
+    assert recorder.params[0]['rows'].endswith(', ...]')
+    assert len(recorder.titles[0]) < report.MAX_PARAM_LENGTH * 2
+
+
+def test_step_policy_collapses_samples_and_budgets_steps(steps):
+    with report.use_step_policy(sample_every=4):
+        for _ in range(10):
+            fill('John')
+        fill('Jane')
+
+    assert steps.titles[:3] == ["Fill the field 'John' [report_test]"] * 3
+    assert steps.titles[3].startswith("Fill the field 'John' [report_test] [x10, ")
+    assert steps.params[3]['count'] == '10'
+    assert steps.titles[4:] == ["Fill the field 'Jane' [report_test]"]
+
+    steps.titles.clear()
+    with report.use_step_policy(budget=3, collapse=False):
+        for name in 'ABCDE':
+            fill(name)
+
+    assert len(steps.titles) == 4
+    assert steps.titles[-1] == 'Step budget of 3 is exhausted, further steps are not reported'
+
+
+def test_profiler_aggregates_steps_per_title_and_owner(tmp_path):
+    profiler.reset()
+    profiler.enable()
+    try:
+        for _ in range(3):
+            LoginPage().sign_in('admin')
+        fill('John')
+    finally:
+        profiler.enable(False)
+
+    profiler.dump(tmp_path / 'steps.json', tmp_path / 'steps.trace.json')
+    summary = json.loads((tmp_path / 'steps.json').read_text())
+    events = json.loads((tmp_path / 'steps.trace.json').read_text())['traceEvents']
+
+    assert summary['steps']['sign in']['count'] == 3
+    assert summary['steps']['Fill the field']['count'] == 1
+    assert set(summary['owners']) == {'LoginPage', 'report_test'}
+    assert {event['ph'] for event in events} == {'X'} and len(events) == 4
+
+
+def test_buffered_steps_are_dispatched_in_order_when_outermost_step_stops(steps):
+    @report.step
+    def outer():
+        inner()
+        assert steps.events == []
+        allure.attach('body', name='page source')
+        assert steps.events[-1] == '@page source'
+
+    @report.step
+    def inner():
+        pass
+
+    with step_buffer.buffered():
+        outer()
+        assert steps.events[-1] == '/'
+
+    assert steps.events == ['outer [report_test]', 'inner [report_test]', '/', '@page source', '/']
+
+
+def test_async_steps_are_timed_when_awaited_and_nested_per_task():
+    listener = AllureListener()
+    plugin_manager.register(listener)
+
+    @report.step
+    async def create_user(name):
+        await asyncio.sleep(0.05)
+        fill(name)
+
+    async def scenario():
+        @gherkin.given('Users exist')
+        async def users_exist():
+            await asyncio.gather(create_user('John'), create_user('Jane'))
+
+        await users_exist
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        plugin_manager.unregister(listener)
+
+    [given] = listener.test.steps
+    john, jane = given.steps
+    assert given.name == 'Users exist'
+    assert [john.name, jane.name] == ["create user 'John' [report_test]", "create user 'Jane' [report_test]"]
+    assert [step.name for step in john.steps + jane.steps] == [
+        "Fill the field 'John' [report_test]", "Fill the field 'Jane' [report_test]"]
+    assert john.stop - john.start >= 50 and jane.start < john.stop
+
+
+def test_step_context_restores_its_parent_when_reentered_or_exited_elsewhere(steps):
+    outer, inner = report.StepContext('outer', {}), report.StepContext('inner', {})
+
+    with outer:
+        with inner:
+            with inner:
+                pass
+            assert report._current_step.get() == inner.uuid
+        assert report._current_step.get() == outer.uuid
+
+    context = contextvars.copy_context()
+    context.run(outer.__enter__)
+    outer.__exit__(None, None, None)
+    assert report._current_step.get() is None and context[report._current_step] == outer.uuid
+
+
+def test_async_gherkin_step_warns_when_never_awaited(steps):
+    ran = []
+
+    with pytest.warns(RuntimeWarning, match="'Nothing happens' was never awaited"):
+        @gherkin.when('Nothing happens')
+        async def nothing_happens():
+            ran.append(1)
+
+        del nothing_happens
+
+    assert ran == [] and steps.titles == []
+
+
+def test_translations_are_applied_in_one_pass_to_steps_and_waits(steps):
+    class Wait:
+        entity = "element('#save')"
+
+    @report.step(translations=(('#save', 'Save button'), ('element', 'Element')))
+    def press(key):
+        pass
+
+    log = log_with(context=report.StepContext, translations=(("'#save'", 'Save'),))
+
+    press('#save')
+    log(Wait())(lambda fn: fn)('click')
+
+    assert steps.titles == ["press 'Save button' [report_test]", 'element(Save): click']
+    assert translator([('a', 'b'), ('b', 'c')])('ab') == 'bc'
+
+
+def test_wait_titles_are_formatted_once_per_entity_and_command(steps):
+    formatted = []
+
+    class Described:
+        def __init__(self, text):
+            self.text = text
+
+        def __str__(self):
+            formatted.append(self.text)
+            return self.text
+
+    class Wait:
+        def __init__(self, entity):
+            self.entity = entity
+
+    element, click, clear = Described('element'), Described('click'), Described('clear')
+    log = log_with(context=report.StepContext)
+
+    for fn in (click, click, clear, click):
+        log(Wait(element))(lambda fn: fn)(fn)
+
+    assert steps.titles == ['element: click', 'element: click', 'element: clear', 'element: click']
+    assert formatted == ['element', 'click', 'element', 'clear']
+
+    for text in ('first', 'second'):
+        entity = Described(text)
+        log(Wait(entity))(lambda fn: fn)(click)
+        del entity
+    assert steps.titles[-2:] == ['first: click', 'second: click']
+
+
+def test_step_policy_collapses_steps_calling_steps(steps):
+    @report.step
+    def outer():
+        fill('John')
+
+    with report.use_step_policy():
+        for _ in range(3):
+            outer()
+
+    assert steps.events[:4] == ['outer [report_test]', "Fill the field 'John' [report_test]", '/', '/']
+    assert steps.events[4].startswith('outer [report_test] [x3, ') and steps.events[5:] == ['/']
+
+
+def test_step_policy_reports_failing_collapsed_steps_within_budget(steps):
+    results = iter([True, True, False, False, False])
+
+    @report.step
+    def check():
+        assert next(results)
+
+    with report.use_step_policy(budget=3):
+        for _ in range(5):
+            with contextlib.suppress(AssertionError):
+                check()
+
+    assert steps.titles[0] == steps.titles[2] == 'check [report_test]'
+    assert steps.titles[1].startswith('check [report_test] [x3, ')
+    assert steps.titles[3:] == ['Step budget of 3 is exhausted, further steps are not reported']
+
+
+@pytest.mark.parametrize('buffered', [False, True])
+def test_async_steps_are_nested_per_task_and_bounded_by_policy(buffered):
+    listener = AllureListener()
+    plugin_manager.register(listener)
+
+    @report.step
+    async def create_user(name):
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            fill(name)
+
+    @report.step
+    async def users_exist():
+        await asyncio.gather(create_user('John'), create_user('Jane'))
+
+    try:
+        with step_buffer.buffered() if buffered else contextlib.nullcontext(), report.use_step_policy():
+            asyncio.run(users_exist())
+    finally:
+        plugin_manager.unregister(listener)
+
+    [given] = listener.test.steps
+    john, jane = given.steps
+    assert [john.name, jane.name] == ["create user 'John' [report_test]", "create user 'Jane' [report_test]"]
+    for step, name in [(john, 'John'), (jane, 'Jane')]:
+        first, aggregated = step.steps
+        assert first.name == f"Fill the field '{name}' [report_test]"
+        assert aggregated.name.startswith(f"Fill the field '{name}' [report_test] [x5, ")
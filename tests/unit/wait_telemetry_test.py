@@ -0,0 +1,60 @@
+import pytest
+from selene.core.exceptions import TimeoutException
+from selene.core.wait import Wait
+
+from selenite.conf.allure.report import StepContext
+from selenite.core.web.selene import wait_telemetry
+from selenite.core.web.selene.report import log_with
+
+
+class Entity:
+    def __str__(self):
+        return "element('#save')"
+
+
+class Flaky:
+    def __init__(self, failures):
+        self.failures = failures
+
+    def __call__(self, entity):
+        if self.failures:
+            self.failures -= 1
+            raise AssertionError('not yet')
+
+    def __str__(self):
+        return 'be.clickable'
+
+
+def test_waits_are_recorded_per_entity_and_condition():
+    wait_telemetry.reset()
+    wait = Wait(Entity(), at_most=0.2, _decorator=wait_telemetry.recorded(log_with(context=StepContext)))
+
+    wait.for_(Flaky(failures=3))
+    wait.for_(Flaky(failures=0))
+    with pytest.raises(TimeoutException, match="element\\('#save'\\).be.clickable"):
+        wait.for_(Flaky(failures=10 ** 9))
+
+    [stats] = wait_telemetry.summary()['most_retried']
+    assert stats['entity'] == "element('#save')" and stats['command'] == 'be.clickable'
+    assert stats['count'] == 3 and stats['failures'] == 1
+    assert stats['polls'] == 4 + 1 + stats['max_polls']
+    assert stats['max'] >= 0.2
+
+
+def test_wrapped_decorator_receives_the_original_condition():
+    received = []
+
+    def inner(wait):
+        def decorator(for_):
+            def decorated(fn):
+                received.append(fn)
+                return for_(fn)
+            return decorated
+        return decorator
+
+    wait = Wait(Entity(), at_most=0.2, _decorator=wait_telemetry.recorded(inner))
+    condition = Flaky(failures=2)
+    wait.for_(condition)
+    wait.for_(condition)
+
+    assert received == [condition, condition]
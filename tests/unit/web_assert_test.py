@@ -0,0 +1,83 @@
+import time
+
+import pytest
+from selene import browser
+
+from selenite import common
+from selenite.common.web_assert import web_assert
+from selenite.core.web.generic_page.form_page import FormPage
+
+
+@pytest.fixture
+def failures(monkeypatch):
+    hooked = []
+
+    def hook(error):
+        hooked.append(error)
+        return error
+
+    monkeypatch.setattr(browser.config, 'timeout', 2)
+    monkeypatch.setattr(browser.config, 'save_screenshot_on_failure', False)
+    monkeypatch.setattr(browser.config, 'save_page_source_on_failure', False)
+    monkeypatch.setattr(browser.config, 'hook_wait_failure', hook)
+    return hooked
+
+
+def test_evaluated_conditions_fail_fast_through_hooks(failures):
+    started = time.perf_counter()
+    with pytest.raises(Exception, match='Object 4 should be in container'):
+        web_assert.is_in(4, [1, 2, 3])
+
+    assert time.perf_counter() - started < 0.5
+    assert len(failures) == 1
+
+
+def test_eventually_polls_condition_until_it_holds(failures):
+    values = iter([False, False, True])
+    web_assert.eventually(lambda: next(values))
+
+    with pytest.raises(Exception, match='Cart should be empty'):
+        web_assert.eventually(lambda: False, 'Cart should be empty', timeout=0.2)
+    assert len(failures) == 1
+
+
+def test_soft_assertions_raise_once_with_every_failure(failures):
+    with pytest.raises(Exception) as error:
+        with web_assert.soft() as collected:
+            web_assert.is_equal('John', 'Jane')
+            web_assert.is_true(True)
+            web_assert.is_in(4, [1, 2, 3])
+            web_assert.eventually(lambda: False, 'Cart should be empty', timeout=0.1)
+            assert len(collected) == 3 and failures == []
+
+    assert '3 soft assertion(s) failed' in str(error.value)
+    assert '1. Actual value John is not equal to expected value Jane' in str(error.value)
+    assert '3. Cart should be empty' in str(error.value)
+    assert len(failures) == 1
+
+
+def test_soft_assertions_collect_form_page_failures(failures, monkeypatch):
+    class Users(FormPage):
+        ths = ['name', 'city']
+        table_text_list = [['John', 'Paris']]
+
+        def get_row_attribute_by_text(self, row_keyword, attribute):
+            return common.convert.zip_dict(self.ths, *self.table_text_list)[0][attribute]
+
+    monkeypatch.setattr(browser.config, 'timeout', 0.1)
+    users = Users()
+
+    with pytest.raises(Exception) as error:
+        with web_assert.soft():
+            users.should_contain_sub_dictionary({'name': 'John'})
+            users.should_contain_sub_dictionary({'name': 'Jane'})
+            users.should_not_contain_sub_dictionary({'city': 'Paris'})
+            users.should_contain_sub_list(['Jane'])
+            users.should_have_row_attribute('John', 'city', 'Rome')
+            users.should_have_row_attribute('John', 'age', '42')
+
+    assert '5 soft assertion(s) failed' in str(error.value)
+    assert "1. Table should contain a row matching {'name': 'Jane'}" in str(error.value)
+    assert '4. Row John should have city Rome, actual value Paris' in str(error.value)
+    assert "5. Row John should have age 42, actual value not found (KeyError: 'age')" in str(error.value)
+    assert len(failures) == 1